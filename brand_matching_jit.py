@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+브랜드 매칭 시스템 - Numba JIT 가속 함수 모음
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.warning("numba not available, JIT scoring kernels run as plain python")
+
+
+def _best_weighted_candidate(product_sim, size_sim, color_sim, check_size):
+    """match_row 2단계 종합 유사도 축약 - (최고 후보 위치, 종합 유사도), 후보 없으면 (-1, 0.0)
+
+    종합 = 상품 45% + 사이즈 30% + 색상 20% + 가격(중립 50) 5%.
+    사이즈 50 미만(check_size일 때)과 종합 60 미만은 제외, 92 이상이면 그 후보에서 즉시 종료
+    """
+    best_position = -1
+    best_total = 0.0
+    for i in range(product_sim.shape[0]):
+        if check_size and size_sim[i] < 50:
+            continue
+        total = product_sim[i] * 0.45 + size_sim[i] * 0.30 + color_sim[i] * 0.20 + 50.0 * 0.05
+        if total < 60:
+            continue
+        if total >= 92:
+            return i, total
+        if total > best_total:
+            best_position = i
+            best_total = total
+    return best_position, best_total
+
+
+def _apply_numeric_size_tiers(numbers1, numbers2, matrix):
+    """숫자 사이즈 쌍의 유사도 칸을 차이 단계로 덮어씀 (-1은 숫자가 아닌 사이즈)
+
+    차이 0 → 1.0, 5 이하 → 0.8, 10 이하 → 0.6, 그보다 크면 문자열 유사도 유지
+    """
+    for i in range(numbers1.shape[0]):
+        if numbers1[i] < 0:
+            continue
+        for j in range(numbers2.shape[0]):
+            if numbers2[j] < 0:
+                continue
+            diff = abs(numbers1[i] - numbers2[j])
+            if diff == 0:
+                matrix[i, j] = 1.0
+            elif diff <= 5:
+                matrix[i, j] = 0.8
+            elif diff <= 10:
+                matrix[i, j] = 0.6
+
+
+# numba가 없으면 같은 코드를 파이썬 함수로 그대로 사용
+best_weighted_candidate = (njit(cache=True, nogil=True)(_best_weighted_candidate)
+                           if NUMBA_AVAILABLE else _best_weighted_candidate)
+apply_numeric_size_tiers = (njit(cache=True, nogil=True)(_apply_numeric_size_tiers)
+                            if NUMBA_AVAILABLE else _apply_numeric_size_tiers)
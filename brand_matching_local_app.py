@@ -8,22 +8,36 @@
 import pandas as pd
 import os
 import sys
+import atexit
+import queue
+from collections import Counter
 from datetime import datetime
 import logging
+import logging.handlers
 
 # 최적화된 매칭 시스템 import
 from brand_matching_system import BrandMatchingSystem
 from file_processor import BrandFileProcessor
 
-# 로깅 설정
+# 로깅 설정 (QueueHandler → 백그라운드 스레드에서 파일/콘솔 출력)
+# 매칭 루프의 logger 호출은 큐에 넣기만 하고, 실제 디스크 I/O는 리스너 스레드가 담당
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_file_handler = logging.FileHandler('brand_matching.log', encoding='utf-8')
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler(sys.stdout)
+_stream_handler.setFormatter(_log_formatter)
+
+_log_queue = queue.Queue(-1)
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))  # 최종 포맷은 리스너 쪽 핸들러가 적용
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('brand_matching.log', encoding='utf-8'),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[_queue_handler]
 )
+_log_listener = logging.handlers.QueueListener(_log_queue, _file_handler, _stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,17 +57,24 @@ class BrandMatchingLocalApp:
         if not os.path.exists(self.results_dir):
             os.makedirs(self.results_dir)
     
+    def _write_lines(self, lines):
+        """여러 줄을 한 번에 출력 (콘솔 flush 1회)"""
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+    
     def print_menu(self):
         """메뉴 출력"""
-        print("\n" + "="*60)
-        print("🔗 브랜드 매칭 시스템 (로컬 버전)")
-        print("="*60)
-        print("1. 엑셀 파일 매칭 처리")
-        print("2. 브랜드 데이터 새로고침")
-        print("3. 키워드 관리")
-        print("4. 시스템 정보 확인")
-        print("5. 종료")
-        print("="*60)
+        self._write_lines([
+            "\n" + "="*60,
+            "🔗 브랜드 매칭 시스템 (로컬 버전)",
+            "="*60,
+            "1. 엑셀 파일 매칭 처리",
+            "2. 브랜드 데이터 새로고침",
+            "3. 키워드 관리",
+            "4. 시스템 정보 확인",
+            "5. 종료",
+            "="*60,
+        ])
     
     def get_user_choice(self) -> str:
         """사용자 선택 입력"""
@@ -108,7 +129,7 @@ class BrandMatchingLocalApp:
                 if choice == 'y':
                     print("🔍 유사도 매칭 수행 중...")
                     similarity_df = self.matching_system.find_similar_products_for_failed_matches(failed_products)
-                    similarity_matched = len(similarity_df[similarity_df['매칭_상태'] == '유사매칭'])
+                    similarity_matched, _ = BrandMatchingSystem.count_similarity_results(similarity_df)
                     print(f"✅ 유사도 매칭 완료: {similarity_matched:,}/{len(similarity_df):,}개")
             
             # 5단계: 결과 저장
@@ -141,7 +162,7 @@ class BrandMatchingLocalApp:
             print(f"총 상품 수: {len(result_df):,}개")
             print(f"정확 매칭 성공: {matched_count:,}개 ({matched_count/len(result_df)*100:.1f}%)")
             if not similarity_df.empty:
-                similarity_matched = len(similarity_df[similarity_df['매칭_상태'] == '유사매칭'])
+                similarity_matched, _ = BrandMatchingSystem.count_similarity_results(similarity_df)
                 print(f"유사도 매칭 성공: {similarity_matched:,}개")
                 print(f"전체 매칭 성공: {matched_count + similarity_matched:,}개 ({(matched_count + similarity_matched)/len(result_df)*100:.1f}%)")
             print("="*60)
@@ -174,16 +195,18 @@ class BrandMatchingLocalApp:
     def manage_keywords(self):
         """키워드 관리"""
         while True:
-            print("\n" + "-"*60)
-            print("🔧 키워드 관리")
-            print("-"*60)
-            print(f"현재 키워드 수: {len(self.matching_system.keyword_list)}개")
-            print()
-            print("1. 키워드 목록 보기")
-            print("2. 키워드 추가")
-            print("3. 키워드 삭제")
-            print("4. 뒤로 가기")
-            print("-"*60)
+            self._write_lines([
+                "\n" + "-"*60,
+                "🔧 키워드 관리",
+                "-"*60,
+                f"현재 키워드 수: {len(self.matching_system.keyword_list)}개",
+                "",
+                "1. 키워드 목록 보기",
+                "2. 키워드 추가",
+                "3. 키워드 삭제",
+                "4. 뒤로 가기",
+                "-"*60,
+            ])
             
             choice = input("\n선택하세요 (1-4): ").strip()
             
@@ -200,21 +223,20 @@ class BrandMatchingLocalApp:
     
     def show_keywords(self):
         """키워드 목록 보기"""
-        print("\n📋 키워드 목록")
-        print("-"*60)
+        lines = ["\n📋 키워드 목록", "-"*60]
         
         star_keywords = [kw for kw in self.matching_system.keyword_list if kw.startswith('*') and kw.endswith('*')]
         regular_keywords = [kw for kw in self.matching_system.keyword_list if not (kw.startswith('*') and kw.endswith('*'))]
         
-        print(f"\n⭐ 특수 패턴 키워드 ({len(star_keywords)}개):")
-        for i, kw in enumerate(star_keywords, 1):
-            print(f"  {i}. {kw}")
+        lines.append(f"\n⭐ 특수 패턴 키워드 ({len(star_keywords)}개):")
+        lines.extend(f"  {i}. {kw}" for i, kw in enumerate(star_keywords, 1))
         
-        print(f"\n일반 키워드 ({len(regular_keywords)}개):")
-        for i, kw in enumerate(regular_keywords[:20], 1):
-            print(f"  {i}. {kw}")
+        lines.append(f"\n일반 키워드 ({len(regular_keywords)}개):")
+        lines.extend(f"  {i}. {kw}" for i, kw in enumerate(regular_keywords[:20], 1))
         if len(regular_keywords) > 20:
-            print(f"  ... 외 {len(regular_keywords) - 20}개")
+            lines.append(f"  ... 외 {len(regular_keywords) - 20}개")
+        
+        self._write_lines(lines)
     
     def add_keyword(self):
         """키워드 추가"""
@@ -254,48 +276,44 @@ class BrandMatchingLocalApp:
     
     def show_system_info(self):
         """시스템 정보 확인"""
-        print("\n" + "-"*60)
-        print("ℹ️ 시스템 정보")
-        print("-"*60)
+        lines = ["\n" + "-"*60, "ℹ️ 시스템 정보", "-"*60]
         
         # 브랜드 데이터 정보
         if self.matching_system.brand_data is not None:
-            print(f"\n📊 브랜드 데이터:")
-            print(f"  - 상품 수: {len(self.matching_system.brand_data):,}개")
-            print(f"  - 브랜드 수: {len(self.matching_system.brand_index):,}개")
+            lines.append(f"\n📊 브랜드 데이터:")
+            lines.append(f"  - 상품 수: {len(self.matching_system.brand_data):,}개")
+            lines.append(f"  - 브랜드 수: {len(self.matching_system.brand_index):,}개")
             
-            # 브랜드별 상품 수 Top 10
-            brand_counts = {}
-            for idx, row in self.matching_system.brand_data.iterrows():
-                brand = str(row['브랜드']).strip()
-                brand_counts[brand] = brand_counts.get(brand, 0) + 1
+            # 브랜드별 상품 수 Top 10 (인덱스 구축 때 만든 브랜드 문자열 배열을 그대로 집계, iterrows 제거)
+            brand_counts = Counter(self.matching_system._bd_brand_str)
             
-            print(f"\n  상위 10개 브랜드:")
-            for i, (brand, count) in enumerate(sorted(brand_counts.items(), key=lambda x: x[1], reverse=True)[:10], 1):
-                print(f"    {i}. {brand}: {count:,}개")
+            lines.append(f"\n  상위 10개 브랜드:")
+            for i, (brand, count) in enumerate(brand_counts.most_common(10), 1):
+                lines.append(f"    {i}. {brand}: {count:,}개")
         else:
-            print("\n📊 브랜드 데이터: ❌ 로드되지 않음")
+            lines.append("\n📊 브랜드 데이터: ❌ 로드되지 않음")
         
         # 키워드 정보
-        print(f"\n🔧 키워드:")
-        print(f"  - 전체 키워드 수: {len(self.matching_system.keyword_list)}개")
+        lines.append(f"\n🔧 키워드:")
+        lines.append(f"  - 전체 키워드 수: {len(self.matching_system.keyword_list)}개")
         star_keywords = [kw for kw in self.matching_system.keyword_list if kw.startswith('*') and kw.endswith('*')]
-        print(f"  - 특수 패턴 키워드: {len(star_keywords)}개")
-        print(f"  - 일반 키워드: {len(self.matching_system.keyword_list) - len(star_keywords)}개")
+        lines.append(f"  - 특수 패턴 키워드: {len(star_keywords)}개")
+        lines.append(f"  - 일반 키워드: {len(self.matching_system.keyword_list) - len(star_keywords)}개")
         
         # 캐시 정보
-        print(f"\n💾 캐시:")
-        print(f"  - 정규화 캐시 크기: {len(self.matching_system._normalized_cache):,}개")
+        lines.append(f"\n💾 캐시:")
+        lines.append(f"  - 정규화 캐시 크기: {self.matching_system._normalize_cached.cache_info().currsize:,}개")
         
         # 파일 정보
-        print(f"\n📁 결과 파일:")
+        lines.append(f"\n📁 결과 파일:")
         if os.path.exists(self.results_dir):
             result_files = [f for f in os.listdir(self.results_dir) if f.endswith('.xlsx')]
-            print(f"  - 저장된 결과 파일: {len(result_files)}개")
+            lines.append(f"  - 저장된 결과 파일: {len(result_files)}개")
         else:
-            print(f"  - 결과 디렉토리: 없음")
+            lines.append(f"  - 결과 디렉토리: 없음")
         
-        print("-"*60)
+        lines.append("-"*60)
+        self._write_lines(lines)
     
     def run(self):
         """앱 실행"""
@@ -5,15 +5,18 @@
 """
 
 import pandas as pd
+import numpy as np
 import re
 import logging
 import os
-import gc
-from typing import List, Dict, Tuple
+import sys
+import time
+import heapq
+from typing import List, Dict, Tuple, Optional
 from functools import lru_cache
 import concurrent.futures
-from threading import Lock
 from difflib import SequenceMatcher
+from openpyxl.utils import get_column_letter
 
 logger = logging.getLogger(__name__)
 
@@ -24,8 +27,114 @@ except ImportError:
     LEVENSHTEIN_AVAILABLE = False
     logger.warning("python-Levenshtein not available, using fallback similarity calculation")
 
+try:
+    from rapidfuzz import fuzz as rf_fuzz
+    from rapidfuzz import process as rf_process
+    from rapidfuzz.distance import Levenshtein as rf_levenshtein
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+    logger.warning("rapidfuzz not available, using per-pair similarity calculation")
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    logger.warning("pyahocorasick not available, using per-keyword regex removal")
+
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+    logger.warning("xlsxwriter not available, writing Excel files with openpyxl")
+
+try:
+    from joblib.externals.loky import ProcessPoolExecutor as LokyProcessPoolExecutor
+    JOBLIB_AVAILABLE = True
+except ImportError:
+    JOBLIB_AVAILABLE = False
+    logger.warning("joblib not available, matching rows sequentially")
+
+from brand_matching_jit import best_weighted_candidate, apply_numeric_size_tiers
+
 from brand_sheets_api import brand_sheets_api
 
+# 색상 변형 매핑 (한글-영어, 오타 등)
+_COLOR_MAPPINGS = {
+    '메란지': ('멜란지', 'melange', '메렌지'),
+    '멜란지': ('메란지', 'melange', '메렌지'),
+    '블랙': ('black', '검정', '검은색'),
+    '화이트': ('white', '흰색', '하얀색'),
+    '레드': ('red', '빨강', '빨간색'),
+    '블루': ('blue', '파랑', '파란색', '블루'),
+    '그린': ('green', '초록', '초록색'),
+    '옐로우': ('yellow', '노랑', '노란색'),
+    '핑크': ('pink', '분홍', '분홍색'),
+    '그레이': ('gray', 'grey', '회색'),
+    '베이지': ('beige', '베이지색'),
+    '네이비': ('navy', '남색'),
+}
+
+# 사이즈 변형 매핑
+_SIZE_MAPPINGS = {
+    'xs': ('엑스에스', 'x-small', 'extra small'),
+    's': ('에스', 'small', '소'),
+    'm': ('엠', 'medium', '중', '미디움'),
+    'l': ('엘', 'large', '대', '라지'),
+    'xl': ('엑스엘', 'x-large', 'extra large'),
+    'xxl': ('더블엑스엘', '2xl', 'xx-large'),
+    'xxxl': ('트리플엑스엘', '3xl', 'xxx-large'),
+    'free': ('프리', '프리사이즈', 'one size'),
+}
+
+
+def _build_variant_lookup(mappings: Dict[str, Tuple[str, ...]]) -> Dict[str, frozenset]:
+    """{대표값: (변형...)} 매핑을 {표기: 속한 대표값 집합} 형태로 뒤집기"""
+    lookup = {}
+    for main, variants in mappings.items():
+        for term in (main,) + variants:
+            lookup.setdefault(term.lower(), set()).add(main)
+    return {term: frozenset(mains) for term, mains in lookup.items()}
+
+
+# 변형 표기 -> 대표값 집합 역방향 조회 테이블 (import 시 한 번만 구축)
+_COLOR_LOOKUP = _build_variant_lookup(_COLOR_MAPPINGS)
+_SIZE_LOOKUP = _build_variant_lookup(_SIZE_MAPPINGS)
+
+# 브랜드 사이즈 패턴 분해용 (check_size_match의 패턴별 캐시에서 사용)
+_SIZE_CODE_PATTERN = re.compile(r'\b([A-Z]+)(?:\d+)?\b')
+_SIZE_BRACKET_CHARS = re.compile(r'[\[\]()]')
+
+# 편집 거리 백엔드는 import 시 한 번만 결정 (rapidfuzz → python-Levenshtein), 없으면 None
+if RAPIDFUZZ_AVAILABLE:
+    _EDIT_DISTANCE = rf_levenshtein.distance
+elif LEVENSHTEIN_AVAILABLE:
+    _EDIT_DISTANCE = Levenshtein.distance
+else:
+    _EDIT_DISTANCE = None
+
+# 프로세스 병렬 워커의 매칭 시스템 - 워커 기동 시 initializer로 한 번만 받아 두고 청크에는 행 데이터만 보냄
+_worker_system = None
+
+
+def _init_worker_system(system):
+    """loky 워커 initializer - 워커 프로세스당 한 번 매칭 시스템을 받아 전역에 보관"""
+    global _worker_system
+    _worker_system = system
+
+
+def _match_chunk_in_worker(rows):
+    """워커 프로세스에서 (브랜드, 상품명, 사이즈, 색상) 묶음 매칭"""
+    return _worker_system._match_chunk(rows)
+
+
+def _score_chunk_in_worker(jobs):
+    """워커 프로세스에서 매칭 실패 상품 묶음의 유사 상품 평가"""
+    return _worker_system._score_chunk(jobs)
+
+
 class BrandMatchingSystem:
     """
     브랜드 매칭 시스템 - 메모리 최적화 버전
@@ -88,27 +197,89 @@ class BrandMatchingSystem:
         "러블리": ["러블리", "lovely"],
     }
 
+    # 옵션 값 끝에서 제거할 문자 (공백류 + 구분 기호)
+    TRAILING_OPTION_SYMBOLS = ' \t\r\n\f\v/\\|'
+
+    # 상품명 정규화 LRU 캐시 크기 (업로드 상품명 + 브랜드 상품명 전체가 들어갈 수 있도록)
+    NORMALIZE_CACHE_SIZE = 65536
+
+    # 옵션 파싱 LRU 캐시 크기 (같은 SKU 옵션 문자열이 여러 주문에 반복됨)
+    OPTIONS_CACHE_SIZE = 4096
+
+    # 이 행 수 이상일 때만 process_matching을 프로세스 병렬로 실행 (작은 입력은 워커 기동/피클 비용이 더 큼)
+    PARALLEL_MATCH_MIN_ROWS = 2000
+
+    # 이 개수 이상일 때만 매칭 실패 상품의 유사 상품 평가를 프로세스 병렬로 실행 (미만은 순차 처리)
+    PARALLEL_SIMILAR_MIN_ROWS = 500
+
+    # process_matching 진행률 출력/타임아웃 확인 간격 (행 수)
+    PROGRESS_BATCH_SIZE = 10
+
+    # 브랜드가 없거나 인덱스에 없는 실패 상품을 전체 카탈로그에서 찾은 결과의 매칭_상태 (브랜드 내 '유사매칭'과 구분)
+    CATALOG_SIMILAR_STATUS = '전체검색유사매칭'
+    # 유사도 매칭 성공으로 집계하는 매칭_상태 (화면/로컬 앱 통계 공용)
+    SIMILAR_MATCHED_STATUSES = ('유사매칭', CATALOG_SIMILAR_STATUS)
+
+    # 유사도 결과 엑셀의 유사도 컬럼 조건부 서식 (임계값 이상, 높은 값부터 적용)
+    SIMILARITY_FILL_COLORS = ((0.8, "C6EFCE"), (0.6, "FFEB9C"), (0.3, "FFC7CE"))
+
     def __init__(self):
         self.brand_data = None
         self.keyword_list = []
         
-        # 메모리 최적화를 위한 캐시 크기 조정
-        self._normalized_cache = {}
-        self._cache_lock = Lock()
+        # 상품명 정규화 캐시 (C 구현 LRU - 별도 Lock/정리 불필요)
+        self._normalize_cached = lru_cache(maxsize=self.NORMALIZE_CACHE_SIZE)(self._normalize_impl)
+        # 옵션 파싱 캐시 (파싱 패턴은 고정이므로 무효화 불필요)
+        self._parse_options_cached = lru_cache(maxsize=self.OPTIONS_CACHE_SIZE)(self._parse_options_impl)
         self._compiled_patterns = {}
-        self._max_cache_size = 1000  # 캐시 크기 제한
+        self._keyword_automaton = None  # 일반 키워드 Aho-Corasick 오토마톤 (키워드 변경 시 재구축)
+        self._keyword_patterns = []  # (소문자 키워드, 단독 키워드 패턴 또는 None) - 키워드 변경 시 재구축
+        self._keyword_parentheses_pattern = None  # 모든 (키워드)를 한 번에 찾는 단일 alternation 패턴
         self._synonym_cache = {}  # 동의어 확장 캐시
         self._jamo_cache = {}  # 자모 분리 결과 캐시
         self._similarity_cache = {}  # 유사도 계산 캐시
         
         # 속도 최적화를 위한 브랜드 인덱스
-        self.brand_index = {}  # 브랜드명 -> 상품 리스트 매핑
-        
-        # 데이터 로드
-        self.load_brand_data()
-        self.load_keywords()
+        self.brand_index = {}  # 브랜드명 -> 상품 행 위치 리스트 매핑
+        
+        # brand_data 컬럼별 배열 (행 위치로 직접 접근 - row 단위 객체 생성 없음)
+        self._bd_brand = np.empty(0, dtype=object)  # 브랜드 (원본 값)
+        self._bd_product = np.empty(0, dtype=object)  # 상품명 (원본 값)
+        self._bd_brand_str = np.empty(0, dtype=object)  # 브랜드 (문자열, 공백 제거)
+        self._bd_product_str = np.empty(0, dtype=object)  # 상품명 (문자열, 공백 제거)
+        self._bd_brand_lc = np.empty(0, dtype=object)  # 브랜드 (문자열, 공백 제거, 소문자) - 인덱스 키
+        self._bd_options = np.empty(0, dtype=object)  # 옵션입력 (문자열, 공백 제거)
+        self._bd_wholesale = np.empty(0, dtype=object)  # 중도매 (원본 값)
+        self._bd_supply = np.empty(0, dtype=object)  # 공급가 (원본 값)
+        self._bd_product_norm = np.empty(0, dtype=object)  # 정규화된 상품명
+        self._bd_product_norm_len = np.empty(0, dtype=np.int64)  # 정규화된 상품명 길이 (match_row 길이 비율 사전 필터)
+        self._exact_product_index = {}  # (브랜드, 정규화 상품명) -> 행 위치 리스트 (match_row 정확 일치 프로브)
+        self._brand_similarity_forms = {}  # 브랜드 -> (비교용 상품명, 동의어 확장, 자모 분리) 리스트 (match_row 사전 필터용)
+        self._catalog_positions = []  # 인덱스에 등록된 전체 상품 행 위치 (브랜드 미등록 실패 상품의 전체 카탈로그 검색용)
+        self._catalog_choices = []  # _catalog_positions 순서의 비교용 정규화 상품명
+        self._bd_color = np.empty(0, dtype=object)  # 옵션입력의 색상{...} 내용 (extract_color)
+        self._bd_size = np.empty(0, dtype=object)  # 옵션입력의 사이즈{...} 내용 (extract_size)
+        self._bd_color_variants = np.empty(0, dtype=object)  # 색상 변형 튜플 (parse_color_variants)
+        self._bd_size_variants = np.empty(0, dtype=object)  # 사이즈 변형 튜플 (parse_size_variants)
+        self._bd_size_variant_numbers = np.empty(0, dtype=object)  # 사이즈 변형별 숫자값 배열 (_size_variant_numbers)
+        
+        # 데이터 로드 (상품명 정규화에 키워드/패턴이 필요하므로 먼저 준비)
         self._precompile_patterns()
-        self._build_brand_index()
+        self.load_keywords()
+        self.load_brand_data()
+
+    def __getstate__(self):
+        """joblib(loky) 워커로 보낼 때 피클할 수 없는 LRU 캐시(정규화/옵션 파싱)는 제외"""
+        state = self.__dict__.copy()
+        state.pop('_normalize_cached', None)
+        state.pop('_parse_options_cached', None)
+        return state
+
+    def __setstate__(self, state):
+        """워커에서 복원 시 LRU 캐시(정규화/옵션 파싱)를 새로 생성"""
+        self.__dict__.update(state)
+        self._normalize_cached = lru_cache(maxsize=self.NORMALIZE_CACHE_SIZE)(self._normalize_impl)
+        self._parse_options_cached = lru_cache(maxsize=self.OPTIONS_CACHE_SIZE)(self._parse_options_impl)
 
     def _precompile_patterns(self):
         """자주 사용되는 정규식 패턴들을 미리 컴파일"""
@@ -117,6 +288,9 @@ class BrandMatchingSystem:
             'brackets': r'\[[^\]]*\]',
             'braces': r'\{[^}]*\}',
             'special_chars': r'[^\w\s가-힣]',
+            'inner_parentheses': r'\([^()]*\)',
+            # 업로드 E열의 괄호 포함 브랜드 분리 (예: 클라레오(기린) 상품명)
+            'brand_bracket_split': r'^([^)]+\)[^)]*?)\s+(.+)$',
             'multiple_spaces': r'\s+',
             'comma_spaces': r'\s*,\s*',
             'multiple_commas': r',+',
@@ -132,10 +306,20 @@ class BrandMatchingSystem:
             'size_m_jxl_dash': r'\([mM]-[jJ][xX][lL]\)',
             'size_numbers': r'\([0-9]+[~-][0-9]+\)',
             'size_js_patterns': r'\([jJ][sS][~-][jJ][xXlLmM]+\)',
+            # 사이즈 정규화/정확 매칭 패턴들 (normalize_size_format, check_size_match - 대문자 기준)
+            'size_range': r'^([A-Z]+)\s*[\(]?([0-9]+)\s*[-~]\s*([0-9]+)\s*[\)]?$',
+            'size_word_s': r'\bS\b',
+            'size_word_m': r'\bM\b',
+            'size_word_l': r'\bL\b',
+            'size_word_xl': r'\bXL\b',
             
             # 옵션 파싱 패턴들
             'color_keywords': r'(?:색상|컬러|Color)',
             'size_keywords': r'(?:사이즈|Size)',
+            'color_eq': r'(?:색상|컬러|Color)\s*=\s*([^,/]+?)(?:\s*[,/]|\s*(?:사이즈|Size)|$)',
+            'color_colon': r'(?:색상|컬러|Color)\s*:\s*([^,/]+?)(?:\s*[,/]|\s*(?:사이즈|Size)|$)',
+            'size_eq': r'(?:사이즈|Size)\s*[=:]\s*([^,/]+?)(?:\s*[,/]|$)',
+            'size_colon': r'(?:사이즈|Size)\s*:\s*([^,/]+?)(?:\s*[,/]|$)',
             'slash_pattern': r'^([^/]+)/([^/]+)$',
             'dash_pattern': r'^([^-]+)-([^-]+)$',
             'size_check': r'[0-9]|[SMLX]',
@@ -144,12 +328,15 @@ class BrandMatchingSystem:
             # 브랜드매칭시트 패턴들
             'size_pattern': r'사이즈\s*[\{\[\(]([^}\]\)]+)[\}\]\)]',
             'color_pattern': r'색상\s*[\{\[\(]([^}\]\)]+)[\}\]\)]',
+            'size_block': r'사이즈\{([^}]*)\}',
+            'color_block': r'색상\{([^}]*)\}',
             'option_split': r'[,/\s]+',
         }
         
         for name, pattern in patterns.items():
             try:
-                if name in ['color_keywords', 'size_keywords', 'size_check', 'exact_size']:
+                if name in ['color_keywords', 'size_keywords', 'color_eq', 'color_colon', 'size_eq', 'size_colon',
+                            'size_check', 'exact_size']:
                     self._compiled_patterns[name] = re.compile(pattern, re.IGNORECASE)
                 else:
                     self._compiled_patterns[name] = re.compile(pattern)
@@ -158,44 +345,288 @@ class BrandMatchingSystem:
         
         logger.info(f"정규식 패턴 {len(patterns)}개 컴파일 완료")
 
-    def _clean_cache(self):
-        """캐시 크기가 제한을 초과할 때 정리"""
-        with self._cache_lock:
-            if len(self._normalized_cache) > self._max_cache_size:
-                # 오래된 항목의 절반 제거
-                items_to_remove = len(self._normalized_cache) // 2
-                keys_to_remove = list(self._normalized_cache.keys())[:items_to_remove]
-                for key in keys_to_remove:
-                    del self._normalized_cache[key]
-                
-                # 메모리 정리
-                gc.collect()
-                logger.info(f"캐시 정리 완료: {items_to_remove}개 항목 제거")
+    def _build_keyword_automaton(self):
+        """일반 키워드(*패턴 제외)로 Aho-Corasick 오토마톤 구축 - 상품명당 한 번의 스캔으로 전체 키워드 탐색"""
+        self._keyword_automaton = None
+        if not AHOCORASICK_AVAILABLE or not self.keyword_list:
+            return
+        
+        automaton = ahocorasick.Automaton()
+        word_boundary = self._compiled_patterns.get('word_boundary')
+        for keyword in self.keyword_list:
+            if not keyword or keyword.startswith('*'):
+                continue
+            key = keyword.lower()
+            # _build_keyword_patterns와 동일하게 한글/영숫자 키워드는 단어 경계(\b)에서만 제거
+            bounded = bool(word_boundary and word_boundary.match(keyword))
+            automaton.add_word(key, (len(key), bounded))
+        
+        if len(automaton) > 0:
+            automaton.make_automaton()
+            self._keyword_automaton = automaton
+
+    @staticmethod
+    def _is_word_boundary(text: str, pos: int) -> bool:
+        """정규식 \\b와 같은 단어 경계 판정"""
+        before = pos > 0 and (text[pos - 1].isalnum() or text[pos - 1] == '_')
+        after = pos < len(text) and (text[pos].isalnum() or text[pos] == '_')
+        return before != after
+
+    def _remove_keywords(self, text: str) -> str:
+        """오토마톤 한 번의 스캔으로 찾은 키워드 구간을 합쳐서 제거"""
+        spans = []
+        for end, (length, bounded) in self._keyword_automaton.iter(text):
+            start = end - length + 1
+            if bounded and not (self._is_word_boundary(text, start) and self._is_word_boundary(text, end + 1)):
+                continue
+            spans.append((start, end + 1))
+        
+        if not spans:
+            return text
+        
+        spans.sort()
+        parts = []
+        last = 0
+        for start, end in spans:
+            if start > last:
+                parts.append(text[last:start])
+            last = max(last, end)
+        parts.append(text[last:])
+        return ''.join(parts)
+
+    def _strip_parenthesized_keywords(self, text: str) -> str:
+        """원본 상품명에서 (키워드) 형태만 제거 - 정규화 결과가 너무 짧을 때 사용"""
+        if self._keyword_parentheses_pattern is not None and '(' in text:
+            text = self._keyword_parentheses_pattern.sub('', text)
+        return self._compiled_patterns['multiple_spaces'].sub(' ', text).strip()
+
+    def _build_keyword_patterns(self):
+        """키워드별 단독 키워드 패턴과 전체 (키워드) alternation 패턴을 한 번만 컴파일 (*패턴 키워드는 단독 패턴 없음)"""
+        word_boundary = self._compiled_patterns.get('word_boundary')
+        self._keyword_patterns = []
+        for keyword in self.keyword_list:
+            if not keyword:
+                continue
+            escaped_keyword = re.escape(keyword)
+            if keyword.startswith('*'):
+                standalone_pattern = None
+            elif word_boundary and word_boundary.match(keyword):
+                standalone_pattern = re.compile(r'\b' + escaped_keyword + r'\b', re.IGNORECASE)
+            else:
+                standalone_pattern = re.compile(escaped_keyword, re.IGNORECASE)
+            self._keyword_patterns.append((keyword.lower(), standalone_pattern))
+        
+        # 긴 키워드를 먼저 두어 (S~XL) 같은 키워드가 짧은 키워드보다 우선 매칭되도록 함
+        keywords = sorted({keyword for keyword in self.keyword_list if keyword}, key=len, reverse=True)
+        self._keyword_parentheses_pattern = re.compile(
+            r'\((?:' + '|'.join(re.escape(keyword) for keyword in keywords) + r')\)', re.IGNORECASE
+        ) if keywords else None
+
+    def _on_keywords_changed(self):
+        """키워드 변경 시 정규화 결과가 달라지므로 캐시와 미리 정규화한 상품명을 갱신"""
+        self._build_keyword_patterns()
+        self._build_keyword_automaton()
+        self._normalize_cached.cache_clear()
+        if len(self._bd_product_str):
+            self._precompute_brand_product_norm()
+
+    def _column_values(self, column: str) -> np.ndarray:
+        """brand_data 컬럼을 파이썬 값 객체 배열로 변환 (컬럼이 없으면 빈 문자열)"""
+        if column not in self.brand_data.columns:
+            return np.full(len(self.brand_data), '', dtype=object)
+        return np.array(self.brand_data[column].tolist(), dtype=object)
+
+    @staticmethod
+    def _object_array(values: list) -> np.ndarray:
+        """튜플 등을 원소 그대로 담는 1차원 객체 배열 (np.array는 튜플을 2차원으로 펼침)"""
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        return array
+
+    def _extract_option_blocks(self, options: pd.Series, pattern_name: str) -> np.ndarray:
+        """옵션입력 컬럼 전체에서 색상{...}/사이즈{...} 내용을 한 번에 추출 (extract_color/extract_size와 동일한 결과)"""
+        contents = options.str.extract(self._compiled_patterns[pattern_name], expand=False).fillna('')
+        contents = contents.str.strip().str.lower().str.replace('|', ' ', regex=False).str.replace('\\', ' ', regex=False)
+        return contents.to_numpy(dtype=object)
 
     def _build_brand_index(self):
-        """브랜드별 인덱스 구축 - row 데이터 포함 (iloc 제거로 100배 향상)"""
+        """브랜드별 인덱스 구축 - 컬럼별 배열 캐시 포함 (iloc 제거로 100배 향상)"""
         if self.brand_data is None or self.brand_data.empty:
             logger.warning("브랜드 데이터가 없어 인덱스를 구축할 수 없습니다")
             self.brand_index = {}
+            self._bd_brand = self._bd_product = self._bd_options = np.empty(0, dtype=object)
+            self._bd_brand_str = self._bd_product_str = self._bd_brand_lc = np.empty(0, dtype=object)
+            self._bd_wholesale = self._bd_supply = self._bd_product_norm = np.empty(0, dtype=object)
+            self._bd_color = self._bd_size = np.empty(0, dtype=object)
+            self._bd_color_variants = self._bd_size_variants = np.empty(0, dtype=object)
+            self._bd_size_variant_numbers = np.empty(0, dtype=object)
+            self._brand_similarity_forms = {}
+            self._bd_product_norm_len = np.empty(0, dtype=np.int64)
+            self._exact_product_index = {}
+            self._catalog_positions = []
+            self._catalog_choices = []
             return
         
-        logger.info("🚀 브랜드 인덱스 구축 중... (row 데이터 포함)")
-        self.brand_index = {}
-        
-        # ⚡ to_dict('records')로 변환하여 빠른 접근 (iloc 완전 제거!)
-        brand_data_records = self.brand_data.to_dict('records')
+        logger.info("🚀 브랜드 인덱스 구축 중... (컬럼 배열 캐시)")
+        
+        # ⚡ 컬럼별 배열로 한 번만 변환 (iloc/row dict 완전 제거!)
+        self._bd_brand = self._column_values('브랜드')
+        self._bd_product = self._column_values('상품명')
+        self._bd_options = np.array([str(value).strip() for value in self._column_values('옵션입력')], dtype=object)
+        self._bd_wholesale = self._column_values('중도매')
+        self._bd_supply = self._column_values('공급가')
+        
+        # 문자열 변환/공백 제거/소문자화는 로드 시 한 번만 (조회마다 반복하지 않음)
+        brand_str = pd.Series(self._bd_brand, dtype=object).map(str).str.strip()
+        self._bd_brand_str = brand_str.to_numpy(dtype=object)
+        # 브랜드 키는 intern하여 인덱스 조회 시 동일 객체 비교로 끝나도록
+        self._bd_brand_lc = np.array([sys.intern(brand) for brand in brand_str.str.lower()], dtype=object)
+        self._bd_product_str = pd.Series(self._bd_product, dtype=object).map(str).str.strip().to_numpy(dtype=object)
+        
+        # 브랜드 상품의 색상/사이즈 패턴도 한 번만 추출 (후보마다 정규식 재실행 방지) - 컬럼 단위 str.extract
+        options = pd.Series(self._bd_options, dtype=object)
+        self._bd_color = self._extract_option_blocks(options, 'color_block')
+        self._bd_size = self._extract_option_blocks(options, 'size_block')
+        self._bd_color_variants = self._object_array([self.parse_color_variants(color) for color in self._bd_color])
+        self._bd_size_variants = self._object_array([self.parse_size_variants(size) for size in self._bd_size])
+        self._bd_size_variant_numbers = self._object_array(
+            [self._size_variant_numbers(variants) for variants in self._bd_size_variants]
+        )
+        
+        # ⚡ groupby 한 번으로 브랜드별 행 위치 목록 생성 (값은 self._bd_*[position])
+        brands = pd.Series(self._bd_brand_lc, dtype=object)
+        brands = brands[brands.ne('') & brands.ne('nan')]
+        self.brand_index = {
+            sys.intern(brand): positions.tolist()
+            for brand, positions in brands.groupby(brands, sort=False).groups.items()
+        }
         
-        for row_dict in brand_data_records:
-            brand = str(row_dict.get('브랜드', '')).strip().lower()
-            if brand and brand != 'nan':
-                if brand not in self.brand_index:
-                    self.brand_index[brand] = []
-                # row 데이터를 직접 저장 (인덱스 불필요)
-                self.brand_index[brand].append(row_dict)
+        self._precompute_brand_product_norm()
         
         logger.info(f"✅ 브랜드 인덱스 구축 완료: {len(self.brand_index):,}개 브랜드")
         logger.info(f"⚡ iloc 제거로 매칭 속도 100배 향상!")
 
+    def _precompute_brand_product_norm(self):
+        """브랜드 상품명을 한 번만 정규화해 두기 (매칭/유사도 매칭에서 후보마다 재계산 방지)"""
+        self._bd_product_norm = np.array(
+            [self.normalize_product_name(product) for product in self._bd_product_str],
+            dtype=object
+        )
+        # (브랜드, 비교용 정규화 상품명) -> 브랜드 인덱스 순서의 전체 행 위치 (match_row 정확 일치 프로브)
+        # 같은 상품명이 옵션(색상/사이즈)만 다르게 여러 행에 있을 수 있으므로 모든 행을 보관
+        self._exact_product_index = {}
+        for brand_lower, positions in self.brand_index.items():
+            for idx in positions:
+                product_key = self._bd_product_norm[idx].lower().strip()
+                if product_key:
+                    self._exact_product_index.setdefault((brand_lower, product_key), []).append(idx)
+        self._bd_product_norm_len = np.fromiter((len(product) for product in self._bd_product_norm),
+                                                dtype=np.int64, count=len(self._bd_product_norm))
+        
+        # match_row 1단계 사전 필터용: calculate_similarity가 비교하는 세 가지 형태를 브랜드별로 미리 준비
+        # 유사도 매칭의 전체 카탈로그 검색용: 브랜드별 비교용 상품명을 이어붙인 목록
+        self._brand_similarity_forms = {}
+        self._catalog_positions = []
+        self._catalog_choices = []
+        if RAPIDFUZZ_AVAILABLE:
+            for brand_lower, positions in self.brand_index.items():
+                plain = [self._bd_product_norm[idx].lower().strip() for idx in positions]
+                self._brand_similarity_forms[brand_lower] = (
+                    plain,
+                    [self.expand_with_synonyms(text) for text in plain],
+                    [self.split_jamo(text) for text in plain],
+                )
+                self._catalog_positions.extend(positions)
+                self._catalog_choices.extend(plain)
+
+    def _string_similarity_matrix(self, queries: List[str], choices: List[str],
+                                  score_cutoff: float = 0.0) -> np.ndarray:
+        """queries × choices 문자열 유사도 행렬 (calculate_string_similarity와 동일한 0.0 ~ 1.0 척도)
+        
+        rapidfuzz가 있으면 cdist 한 번으로 전체 행렬을 C 레벨(bit-parallel Levenshtein)에서 계산,
+        없으면 쌍마다 calculate_string_similarity.
+        score_cutoff 미만 값은 0.0 (rapidfuzz는 컷오프를 넘을 수 없는 쌍의 계산을 중간에 끝냄)
+        """
+        if not queries or not choices:
+            return np.zeros((len(queries), len(choices)), dtype=np.float64)
+        
+        if not RAPIDFUZZ_AVAILABLE:
+            matrix = np.array([[self.calculate_string_similarity(q, c) for c in choices] for q in queries],
+                              dtype=np.float64)
+            matrix[matrix < score_cutoff] = 0.0
+            return matrix
+        
+        queries = [q.lower().strip() if q else "" for q in queries]
+        choices = [c.lower().strip() if c else "" for c in choices]
+        # 작은 행렬(색상/사이즈 변형 비교 등)은 스레드 분배 비용이 더 크므로 단일 스레드
+        workers = -1 if len(queries) * len(choices) >= 10000 else 1
+        # rapidfuzz는 컷오프를 거리로 환산할 때 경계값(예: 1 - 7/10)을 놓칠 수 있어 조금 낮춰 넘기고 아래에서 정확히 자름
+        matrix = rf_process.cdist(queries, choices, scorer=rf_levenshtein.normalized_similarity,
+                                  dtype=np.float64, workers=workers, score_cutoff=max(score_cutoff - 1e-3, 0.0))
+        matrix[matrix < score_cutoff] = 0.0
+        
+        # 빈 문자열은 calculate_string_similarity와 동일하게 0.0
+        matrix[[not q for q in queries], :] = 0.0
+        matrix[:, [not c for c in choices]] = 0.0
+        return matrix
+
+    def _max_color_variant_similarity(self, variants1: tuple, variants2: tuple) -> float:
+        """색상 변형 목록 간 calculate_color_similarity 최댓값 (문자열 유사도는 행렬 한 번에 계산)"""
+        if not variants1 or not variants2:
+            return 0.0
+        
+        matrix = self._string_similarity_matrix(list(variants1), list(variants2))
+        
+        # 같은 대표 색상에 속하는 쌍은 0.95 (calculate_color_similarity와 동일)
+        groups2 = [_COLOR_LOOKUP.get(c2.lower()) if c2 else None for c2 in variants2]
+        for i, c1 in enumerate(variants1):
+            groups1 = _COLOR_LOOKUP.get(c1.lower()) if c1 else None
+            if not groups1:
+                continue
+            for j, group in enumerate(groups2):
+                if group and not groups1.isdisjoint(group):
+                    matrix[i, j] = 0.95
+        return float(matrix.max())
+
+    @staticmethod
+    def _size_variant_numbers(variants: tuple) -> np.ndarray:
+        """사이즈 변형별 숫자값 (int64, 숫자 사이즈가 아니면 -1) - 브랜드 상품은 인덱스 구축 시 한 번만 계산"""
+        return np.array([int(variant) if variant.isdecimal() else -1 for variant in variants], dtype=np.int64)
+
+    def _max_size_variant_similarity(self, variants1: tuple, variants2: tuple,
+                                     numbers1: np.ndarray = None, numbers2: np.ndarray = None) -> float:
+        """사이즈 변형 목록 간 calculate_size_similarity 최댓값 (문자열 유사도는 행렬 한 번에 계산)
+        
+        numbers1/numbers2: 미리 계산한 _size_variant_numbers (없으면 여기서 계산)
+        """
+        if not variants1 or not variants2:
+            return 0.0
+        
+        matrix = self._string_similarity_matrix(list(variants1), list(variants2))
+        
+        # ⚡ 숫자 사이즈 차이 보정은 JIT 커널에서 정수 비교로 (calculate_size_similarity와 동일한 단계)
+        if numbers1 is None:
+            numbers1 = self._size_variant_numbers(variants1)
+        if numbers2 is None:
+            numbers2 = self._size_variant_numbers(variants2)
+        apply_numeric_size_tiers(numbers1, numbers2, matrix)
+        
+        # 같은 대표 사이즈 보정 (숫자끼리의 쌍은 위에서 처리)
+        lowered2 = [s2.lower() for s2 in variants2]
+        for i, s1 in enumerate(variants1):
+            if not s1:
+                continue
+            groups1 = _SIZE_LOOKUP.get(s1.lower())
+            if not groups1:
+                continue
+            for j, s2_lower in enumerate(lowered2):
+                if not s2_lower or (numbers1[i] >= 0 and numbers2[j] >= 0):
+                    continue
+                groups2 = _SIZE_LOOKUP.get(s2_lower)
+                if groups2 and not groups1.isdisjoint(groups2):
+                    matrix[i, j] = 0.95
+        return float(matrix.max())
+
     def calculate_string_similarity(self, str1: str, str2: str) -> float:
         """문자열 유사도 계산 (0.0 ~ 1.0)"""
         if not str1 or not str2:
@@ -207,72 +638,38 @@ class BrandMatchingSystem:
         if str1 == str2:
             return 1.0
         
-        if LEVENSHTEIN_AVAILABLE:
-            # Levenshtein 거리 기반 유사도
-            max_len = max(len(str1), len(str2))
-            if max_len == 0:
-                return 1.0
-            distance = Levenshtein.distance(str1, str2)
-            return 1.0 - (distance / max_len)
+        max_len = max(len(str1), len(str2))
+        if max_len == 0:
+            return 1.0
+        
+        # Levenshtein 거리 기반 유사도 (import 시 고른 C 백엔드 사용)
+        if _EDIT_DISTANCE is not None:
+            distance = _EDIT_DISTANCE(str1, str2)
         else:
-            # SequenceMatcher 기반 유사도 (fallback)
+            # SequenceMatcher 기반 유사도 (편집 거리 라이브러리가 하나도 없을 때만)
             return SequenceMatcher(None, str1, str2).ratio()
+        return 1.0 - (distance / max_len)
     
     def calculate_color_similarity(self, color1: str, color2: str) -> float:
         """색상 유사도 계산 - 오타 및 변형 허용"""
         if not color1 or not color2:
             return 0.0
         
-        # 기본 문자열 유사도
-        base_similarity = self.calculate_string_similarity(color1, color2)
-        
-        # 색상 변형 매핑 (한글-영어, 오타 등)
-        color_mappings = {
-            '메란지': ['멜란지', 'melange', '메렌지'],
-            '멜란지': ['메란지', 'melange', '메렌지'],
-            '블랙': ['black', '검정', '검은색'],
-            '화이트': ['white', '흰색', '하얀색'],
-            '레드': ['red', '빨강', '빨간색'],
-            '블루': ['blue', '파랑', '파란색', '블루'],
-            '그린': ['green', '초록', '초록색'],
-            '옐로우': ['yellow', '노랑', '노란색'],
-            '핑크': ['pink', '분홍', '분홍색'],
-            '그레이': ['gray', 'grey', '회색'],
-            '베이지': ['beige', '베이지색'],
-            '네이비': ['navy', '남색'],
-        }
-        
-        # 변형 매핑 확인
-        color1_lower = color1.lower()
-        color2_lower = color2.lower()
-        
-        for main_color, variants in color_mappings.items():
-            if (color1_lower == main_color or color1_lower in variants) and \
-               (color2_lower == main_color or color2_lower in variants):
+        # 변형 매핑 확인 (같은 대표 색상에 속하면 높은 유사도)
+        groups1 = _COLOR_LOOKUP.get(color1.lower())
+        if groups1:
+            groups2 = _COLOR_LOOKUP.get(color2.lower())
+            if groups2 and not groups1.isdisjoint(groups2):
                 return 0.95  # 높은 유사도
         
-        return base_similarity
+        # 기본 문자열 유사도
+        return self.calculate_string_similarity(color1, color2)
     
     def calculate_size_similarity(self, size1: str, size2: str) -> float:
         """사이즈 유사도 계산 - 다양한 표기법 허용"""
         if not size1 or not size2:
             return 0.0
         
-        # 기본 문자열 유사도
-        base_similarity = self.calculate_string_similarity(size1, size2)
-        
-        # 사이즈 변형 매핑
-        size_mappings = {
-            'xs': ['엑스에스', 'x-small', 'extra small'],
-            's': ['에스', 'small', '소'],
-            'm': ['엠', 'medium', '중', '미디움'],
-            'l': ['엘', 'large', '대', '라지'],
-            'xl': ['엑스엘', 'x-large', 'extra large'],
-            'xxl': ['더블엑스엘', '2xl', 'xx-large'],
-            'xxxl': ['트리플엑스엘', '3xl', 'xxx-large'],
-            'free': ['프리', '프리사이즈', 'one size'],
-        }
-        
         size1_lower = size1.lower()
         size2_lower = size2.lower()
         
@@ -287,26 +684,17 @@ class BrandMatchingSystem:
             elif diff <= 10:
                 return 0.6
             else:
-                return base_similarity
+                return self.calculate_string_similarity(size1, size2)
         
-        # 변형 매핑 확인
-        for main_size, variants in size_mappings.items():
-            if (size1_lower == main_size or size1_lower in variants) and \
-               (size2_lower == main_size or size2_lower in variants):
+        # 변형 매핑 확인 (같은 대표 사이즈에 속하면 높은 유사도)
+        groups1 = _SIZE_LOOKUP.get(size1_lower)
+        if groups1:
+            groups2 = _SIZE_LOOKUP.get(size2_lower)
+            if groups2 and not groups1.isdisjoint(groups2):
                 return 0.95  # 높은 유사도
         
-        return base_similarity
-
-    @lru_cache(maxsize=200)
-    def _get_keyword_pattern(self, keyword: str) -> re.Pattern:
-        """키워드별 정규식 패턴을 캐시와 함께 생성"""
-        escaped_keyword = re.escape(keyword)
-        
-        # 컴파일된 패턴 사용
-        if 'word_boundary' in self._compiled_patterns and self._compiled_patterns['word_boundary'].match(keyword):
-            return re.compile(r'\b' + escaped_keyword + r'\b', re.IGNORECASE)
-        else:
-            return re.compile(escaped_keyword, re.IGNORECASE)
+        # 기본 문자열 유사도
+        return self.calculate_string_similarity(size1, size2)
 
     def load_keywords(self):
         """키워드 리스트 로드 (엑셀 파일 또는 기본 키워드) - 최적화 버전"""
@@ -349,6 +737,8 @@ class BrandMatchingSystem:
         except Exception as e:
             logger.error(f"키워드 로드 실패: {e}")
             self.keyword_list = []
+        
+        self._on_keywords_changed()
 
     def split_jamo(self, text: str) -> str:
         """
@@ -434,12 +824,33 @@ class BrandMatchingSystem:
         
         return result
     
+    def _similarity_upper_bounds(self, brand_lower: str, query: str) -> np.ndarray:
+        """브랜드 후보 전체에 대한 calculate_similarity 상한값 (0~100) - rapidfuzz cdist 한 번씩으로 계산
+        
+        calculate_similarity는 기본/동의어 확장/자모 분리 중 한 형태의 fuzz.ratio를 돌려주므로,
+        세 형태의 fuzz.ratio 최댓값이 calculate_similarity의 상한이 됨
+        """
+        plain, expanded, jamo = self._brand_similarity_forms[brand_lower]
+        query = query.lower().strip()
+        bounds = rf_process.cdist([query], plain, scorer=rf_fuzz.ratio, dtype=np.float32)[0]
+        for query_form, choices in ((self.expand_with_synonyms(query), expanded), (self.split_jamo(query), jamo)):
+            np.maximum(bounds, rf_process.cdist([query_form], choices, scorer=rf_fuzz.ratio, dtype=np.float32)[0],
+                       out=bounds)
+        return bounds
+
+    @staticmethod
+    def _ratio(str1: str, str2: str) -> float:
+        """두 문자열의 0~100 비율 유사도 - rapidfuzz Indel(fuzz.ratio) 우선, 없으면 SequenceMatcher"""
+        if RAPIDFUZZ_AVAILABLE:
+            return rf_fuzz.ratio(str1, str2)
+        return SequenceMatcher(None, str1, str2).ratio() * 100
+    
     def calculate_similarity(self, str1: str, str2: str) -> float:
         """
         두 문자열 간의 유사도를 계산 (0~100)
         
         3단계 폭포수 방식 (성능 최적화):
-        1. 기본 유사도 (SequenceMatcher) - 가장 빠름
+        1. 기본 유사도 (fuzz.ratio) - 가장 빠름
         2. 동의어 확장 유사도 - 빠름
         3. 자모 분리 유사도 (70% 미만만) - 느림, 마지막 수단
         
@@ -462,7 +873,7 @@ class BrandMatchingSystem:
             return self._similarity_cache[cache_key]
         
         # ⚡ Level 1: 기본 유사도 (가장 빠름)
-        basic_similarity = SequenceMatcher(None, str1, str2).ratio() * 100
+        basic_similarity = self._ratio(str1, str2)
         
         # 조기 종료: 90% 이상이면 완벽!
         if basic_similarity >= 90:
@@ -475,7 +886,7 @@ class BrandMatchingSystem:
         
         expanded_similarity = basic_similarity
         if expanded_str1 != str1 or expanded_str2 != str2:
-            expanded_similarity = SequenceMatcher(None, expanded_str1, expanded_str2).ratio() * 100
+            expanded_similarity = self._ratio(expanded_str1, expanded_str2)
         
         best_similarity = max(basic_similarity, expanded_similarity)
         
@@ -491,7 +902,7 @@ class BrandMatchingSystem:
             jamo2 = self.split_jamo(str2)
             
             if jamo1 and jamo2:
-                jamo_similarity = SequenceMatcher(None, jamo1, jamo2).ratio() * 100
+                jamo_similarity = self._ratio(jamo1, jamo2)
                 best_similarity = max(best_similarity, jamo_similarity)
         
         # 캐시 저장 (메모리 제한)
@@ -505,8 +916,6 @@ class BrandMatchingSystem:
         if not size:
             return ""
         
-        import re
-        
         # 1. 공백 제거
         size = size.strip()
         
@@ -515,7 +924,7 @@ class BrandMatchingSystem:
         # "L(24-36)" → "L(24~36)"
         
         # 사이즈 코드와 숫자 범위 분리
-        match = re.match(r'^([A-Z]+)\s*[\(]?([0-9]+)\s*[-~]\s*([0-9]+)\s*[\)]?$', size)
+        match = self._compiled_patterns['size_range'].match(size)
         if match:
             size_code = match.group(1)
             start_num = match.group(2)
@@ -555,10 +964,13 @@ class BrandMatchingSystem:
             return 0.0
         
         # 사이즈 형식 정규화
-        upload_size = self.normalize_size_format(upload_size.strip().upper())
+        return self._check_normalized_size_match(self.normalize_size_format(upload_size.strip().upper()),
+                                                 brand_size_pattern)
+
+    def _check_normalized_size_match(self, upload_size: str, brand_size_pattern: str) -> float:
+        """check_size_match 본체 - upload_size는 이미 대문자 정규화된 값 (후보마다 다시 정규화하지 않도록 분리)"""
         brand_size_pattern = brand_size_pattern.upper()
-        
-        import re
+        patterns = self._compiled_patterns
         
         # 🚨 주니어 사이즈 명시적 차단 (성인/주니어 혼동 방지)
         # S → JS 차단 (JS만 있고 독립적인 S가 없는 경우)
@@ -567,8 +979,8 @@ class BrandMatchingSystem:
             if 'JS' in brand_size_pattern:
                 # 독립적인 S가 있는지 확인 ([S] 또는 공백 S 공백)
                 has_independent_s = (
-                    re.search(r'\[S\]', brand_size_pattern) or
-                    re.search(r'\bS\b', brand_size_pattern.replace('JS', ''))
+                    '[S]' in brand_size_pattern or
+                    patterns['size_word_s'].search(brand_size_pattern.replace('JS', ''))
                 )
                 if not has_independent_s:
                     return 0.0  # ❌ JS만 있고 S가 없음 → 주니어 전용 → 차단
@@ -577,8 +989,8 @@ class BrandMatchingSystem:
         if upload_size == 'M':
             if 'JM' in brand_size_pattern:
                 has_independent_m = (
-                    re.search(r'\[M\]', brand_size_pattern) or
-                    re.search(r'\bM\b', brand_size_pattern.replace('JM', ''))
+                    '[M]' in brand_size_pattern or
+                    patterns['size_word_m'].search(brand_size_pattern.replace('JM', ''))
                 )
                 if not has_independent_m:
                     return 0.0  # ❌ JM만 있고 M이 없음 → 주니어 전용 → 차단
@@ -587,8 +999,8 @@ class BrandMatchingSystem:
         if upload_size == 'L':
             if 'JL' in brand_size_pattern:
                 has_independent_l = (
-                    re.search(r'\[L\]', brand_size_pattern) or
-                    re.search(r'\bL\b', brand_size_pattern.replace('JL', '').replace('XL', '').replace('XXL', ''))
+                    '[L]' in brand_size_pattern or
+                    patterns['size_word_l'].search(brand_size_pattern.replace('JL', '').replace('XL', '').replace('XXL', ''))
                 )
                 if not has_independent_l:
                     return 0.0  # ❌ JL만 있고 L이 없음 → 주니어 전용 → 차단
@@ -597,15 +1009,14 @@ class BrandMatchingSystem:
         if upload_size == 'XL':
             if 'JXL' in brand_size_pattern:
                 has_independent_xl = (
-                    re.search(r'\[XL\]', brand_size_pattern) or
-                    re.search(r'\bXL\b', brand_size_pattern.replace('JXL', ''))
+                    '[XL]' in brand_size_pattern or
+                    patterns['size_word_xl'].search(brand_size_pattern.replace('JXL', ''))
                 )
                 if not has_independent_xl:
                     return 0.0  # ❌ JXL만 있고 XL이 없음 → 주니어 전용 → 차단
         
         # 1. 정확한 패턴 매칭 ([M] 형태로 존재해야 함)
-        exact_pattern = re.search(rf'\[{re.escape(upload_size)}\]', brand_size_pattern)
-        if exact_pattern:
+        if f'[{upload_size}]' in brand_size_pattern:
             return 100.0  # ✅ 정확히 일치!
         
         # 2. 괄호가 포함된 사이즈 매칭 (새로 추가)
@@ -613,10 +1024,12 @@ class BrandMatchingSystem:
         if upload_size in brand_size_pattern:
             return 100.0  # ✅ 괄호 포함 사이즈 매칭!
         
+        # 브랜드 패턴의 사이즈 코드/토큰 집합 (패턴별로 한 번만 분해)
+        brand_size_codes, size_tokens = self._size_pattern_tokens(brand_size_pattern)
+        
         # 3. 사이즈 코드만 추출하여 매칭
         # 예: "S(10~18)" → "S" 추출
         upload_size_code = upload_size.split('(')[0] if '(' in upload_size else upload_size
-        brand_size_codes = re.findall(r'\b([A-Z]+)(?:\d+)?\b', brand_size_pattern)
         
         if upload_size_code in brand_size_codes:
             return 100.0  # ✅ 사이즈 코드 매칭!
@@ -628,9 +1041,6 @@ class BrandMatchingSystem:
         
         # 5. 괄호 제거 후 단어 단위로 매칭
         # "(XS)[S][M][L][XL]" → "XS S M L XL"
-        cleaned = re.sub(r'[\[\]()]', ' ', brand_size_pattern)
-        size_tokens = [s.strip() for s in cleaned.split() if s.strip()]
-        
         if upload_size in size_tokens:
             return 100.0  # ✅ 단어로 정확히 일치
         
@@ -641,6 +1051,14 @@ class BrandMatchingSystem:
         # 5. 전혀 일치하지 않음
         return 0.0
     
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _size_pattern_tokens(brand_size_pattern: str) -> Tuple[frozenset, frozenset]:
+        """대문자 브랜드 사이즈 패턴 → (사이즈 코드 집합, 괄호 제거 후 단어 집합) - 같은 패턴은 캐시 재사용"""
+        codes = frozenset(_SIZE_CODE_PATTERN.findall(brand_size_pattern))
+        cleaned = _SIZE_BRACKET_CHARS.sub(' ', brand_size_pattern)
+        return codes, frozenset(cleaned.split())
+
     def calculate_price_similarity(self, upload_price, brand_price) -> float:
         """
         가격 유사도 계산 (오매칭 방지)
@@ -695,6 +1113,7 @@ class BrandMatchingSystem:
         keyword = keyword.strip()
         if keyword and keyword not in self.keyword_list:
             self.keyword_list.append(keyword)
+            self._on_keywords_changed()
             return self.save_keywords()
         return False
 
@@ -702,15 +1121,21 @@ class BrandMatchingSystem:
         """키워드 제거"""
         if keyword in self.keyword_list:
             self.keyword_list.remove(keyword)
+            self._on_keywords_changed()
             return self.save_keywords()
         return False
 
     def extract_third_word_from_address(self, address: str) -> str:
         """주소에서 3번째 단어 추출 (띄어쓰기 기준)"""
-        if not address or pd.isna(address):
+        if not address or not self._is_present(address):
             return ""
         
-        address = str(address).strip()
+        return self._third_word(str(address).strip())
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _third_word(address: str) -> str:
+        """공백 기준 3번째 단어 (같은 주소가 여러 주문에 반복되므로 LRU 캐시)"""
         words = address.split()
         
         # 3번째 단어가 있으면 반환, 없으면 빈 문자열
@@ -720,19 +1145,17 @@ class BrandMatchingSystem:
 
     def normalize_product_name(self, name: str) -> str:
         """상품명 정규화 - 캐시 및 메모리 최적화 버전"""
-        if not name or pd.isna(name):
+        if not name or not self._is_present(name):
             return ""
         
         name_str = str(name).strip()
         if not name_str:
             return ""
         
-        # 캐시 확인
-        with self._cache_lock:
-            if name_str in self._normalized_cache:
-                return self._normalized_cache[name_str]
-        
-        # 정규화 처리
+        return self._normalize_cached(name_str)
+
+    def _normalize_impl(self, name_str: str) -> str:
+        """상품명 정규화 실제 처리 (normalize_product_name의 LRU 캐시를 통해 호출)"""
         try:
             normalized = name_str.lower()
             
@@ -741,18 +1164,15 @@ class BrandMatchingSystem:
             # (S(3~4)~XL(7~8)) → 빈 문자열
             # 러블리양말(S~XL) → 러블리양말
             # 티셔츠(FREE) → 티셔츠
-            import re
-            normalized = re.sub(r'\([^()]*\)', '', normalized)  # 1차: 내부 괄호 제거
-            normalized = re.sub(r'\([^()]*\)', '', normalized)  # 2차: 외부 괄호 제거
-            normalized = re.sub(r'\([^()]*\)', '', normalized)  # 3차: 중첩 괄호 대비
+            inner_parentheses = self._compiled_patterns['inner_parentheses']
+            normalized = inner_parentheses.sub('', normalized)  # 1차: 내부 괄호 제거
+            normalized = inner_parentheses.sub('', normalized)  # 2차: 외부 괄호 제거
+            normalized = inner_parentheses.sub('', normalized)  # 3차: 중첩 괄호 대비
             
-            # 나머지 패턴 처리
-            if 'brackets' in self._compiled_patterns:
-                normalized = self._compiled_patterns['brackets'].sub('', normalized)
-            if 'braces' in self._compiled_patterns:
-                normalized = self._compiled_patterns['braces'].sub('', normalized)
-            if 'special_chars' in self._compiled_patterns:
-                normalized = self._compiled_patterns['special_chars'].sub(' ', normalized)
+            # 나머지 패턴 처리 (대괄호 → 중괄호 → 특수문자 순서대로 - 서로 엇갈린 괄호도 기존과 같은 결과)
+            normalized = self._compiled_patterns['brackets'].sub('', normalized)
+            normalized = self._compiled_patterns['braces'].sub('', normalized)
+            normalized = self._compiled_patterns['special_chars'].sub(' ', normalized)
             if 'multiple_spaces' in self._compiled_patterns:
                 normalized = self._compiled_patterns['multiple_spaces'].sub(' ', normalized)
             
@@ -761,13 +1181,16 @@ class BrandMatchingSystem:
             # 키워드 제거 (단순화 - 괄호는 이미 제거됨)
             if self.keyword_list:
                 # 일반 키워드만 제거 (괄호 안의 사이즈 패턴은 이미 제거됨)
-                for keyword in self.keyword_list:
-                    if not keyword or keyword.startswith('*'):
-                        continue
-                    
-                    # 단독 키워드 제거
-                    keyword_pattern = self._get_keyword_pattern(keyword)
-                    normalized = keyword_pattern.sub('', normalized)
+                if self._keyword_automaton is not None:
+                    normalized = self._remove_keywords(normalized)
+                else:
+                    for keyword_lower, standalone_pattern in self._keyword_patterns:
+                        # *패턴 키워드 제외, 부분 문자열로도 없으면 정규식 실행 불필요
+                        if standalone_pattern is None or keyword_lower not in normalized:
+                            continue
+                        
+                        # 단독 키워드 제거
+                        normalized = standalone_pattern.sub('', normalized)
                 
                 # 텍스트 정리
                 if 'comma_spaces' in self._compiled_patterns:
@@ -784,28 +1207,15 @@ class BrandMatchingSystem:
                                       not self._compiled_patterns['korean_alpha_num'].search(normalized)):
                 normalized = name_str.lower()
             
-            # 캐시에 저장 (크기 제한 확인)
-            with self._cache_lock:
-                # ⚡ 데드락 방지: Lock 안에서 직접 정리 (중첩 Lock 방지)
-                if len(self._normalized_cache) >= self._max_cache_size:
-                    # 오래된 항목의 절반 제거
-                    items_to_remove = len(self._normalized_cache) // 2
-                    keys_to_remove = list(self._normalized_cache.keys())[:items_to_remove]
-                    for key in keys_to_remove:
-                        del self._normalized_cache[key]
-                
-                self._normalized_cache[name_str] = normalized
-            
             return normalized
             
         except Exception as e:
             logger.error(f"상품명 정규화 실패 ({name_str}): {e}")
             return name_str.lower()
 
-    @lru_cache(maxsize=200)
     def parse_color_variants(self, color_text: str) -> tuple:
-        """색상 텍스트에서 모든 가능한 변형을 추출 - 캐시 버전"""
-        if not color_text or pd.isna(color_text):
+        """색상 텍스트에서 모든 가능한 변형을 추출 (브랜드 상품은 인덱스 구축 시 미리 계산)"""
+        if not color_text or not self._is_present(color_text):
             return ()
         
         color_text = str(color_text).strip()
@@ -831,10 +1241,9 @@ class BrandMatchingSystem:
         
         return tuple(sorted(variants))
 
-    @lru_cache(maxsize=200)
     def parse_size_variants(self, size_text: str) -> tuple:
-        """사이즈 텍스트에서 모든 가능한 변형을 추출 - 캐시 버전"""
-        if not size_text or pd.isna(size_text):
+        """사이즈 텍스트에서 모든 가능한 변형을 추출 (브랜드 상품은 인덱스 구축 시 미리 계산)"""
+        if not size_text or not self._is_present(size_text):
             return ()
         
         size_text = str(size_text).strip()
@@ -866,6 +1275,11 @@ class BrandMatchingSystem:
             self.brand_data = brand_sheets_api.read_brand_matching_data()
             logger.info(f"브랜드 데이터 로드 완료: {len(self.brand_data)}개 상품")
             
+            # 브랜드명/중도매명은 소수 값이 많은 행에 반복되므로 category로 저장 (메모리 절감, 비교는 정수 코드)
+            for column in ('브랜드', '중도매'):
+                if column in self.brand_data.columns:
+                    self.brand_data[column] = self.brand_data[column].astype('category')
+            
             # 데이터 로드 후 인덱스 재구축 (속도 최적화)
             self._build_brand_index()
             
@@ -875,39 +1289,34 @@ class BrandMatchingSystem:
             self.brand_index = {}
 
     def parse_options(self, option_text: str) -> tuple:
-        """옵션 텍스트에서 색상과 사이즈 추출 - 최적화 버전"""
-        if not option_text or pd.isna(option_text) or str(option_text).strip().lower() == 'nan':
+        """옵션 텍스트에서 색상과 사이즈 추출 - 같은 옵션 문자열은 LRU 캐시 결과 재사용"""
+        if not option_text or not self._is_present(option_text) or str(option_text).strip().lower() == 'nan':
             return "", ""
         
-        option_text = str(option_text).strip()
+        return self._parse_options_cached(str(option_text).strip())
+
+    def _parse_options_impl(self, option_text: str) -> tuple:
+        """옵션 파싱 실제 처리 (parse_options의 LRU 캐시를 통해 호출)"""
         color = ""
         size = ""
         
-        # 컴파일된 패턴 사용
-        color_keywords = self._compiled_patterns['color_keywords']
-        size_keywords = self._compiled_patterns['size_keywords']
-        
         # 패턴 1: 색상=값, 사이즈=값 (등호 사용)
-        color_match = re.search(color_keywords.pattern + r'\s*=\s*([^,/]+?)(?:\s*[,/]|\s*(?:사이즈|Size)|$)', 
-                               option_text, re.IGNORECASE)
+        color_match = self._compiled_patterns['color_eq'].search(option_text)
         if color_match:
             color = color_match.group(1).strip()
         
-        size_match = re.search(size_keywords.pattern + r'\s*[=:]\s*([^,/]+?)(?:\s*[,/]|$)', 
-                              option_text, re.IGNORECASE)
+        size_match = self._compiled_patterns['size_eq'].search(option_text)
         if size_match:
             size = size_match.group(1).strip()
         
         # 패턴 2: 색상: 값, 사이즈: 값 (콜론 사용)
         if not color:
-            color_match = re.search(color_keywords.pattern + r'\s*:\s*([^,/]+?)(?:\s*[,/]|\s*(?:사이즈|Size)|$)', 
-                                   option_text, re.IGNORECASE)
+            color_match = self._compiled_patterns['color_colon'].search(option_text)
             if color_match:
                 color = color_match.group(1).strip()
         
         if not size:
-            size_match = re.search(size_keywords.pattern + r'\s*:\s*([^,/]+?)(?:\s*[,/]|$)', 
-                                  option_text, re.IGNORECASE)
+            size_match = self._compiled_patterns['size_colon'].search(option_text)
             if size_match:
                 size = size_match.group(1).strip()
         
@@ -935,17 +1344,16 @@ class BrandMatchingSystem:
                     color = part1
                     size = part2
         
-        # 불필요한 기호 제거
+        # 불필요한 기호 제거 (끝에 붙은 공백과 / \ | 기호)
         if color:
-            color = re.sub(r'\s*[/\\|]+\s*$', '', color).strip()
+            color = color.rstrip(self.TRAILING_OPTION_SYMBOLS).strip()
         if size:
-            size = re.sub(r'\s*[/\\|]+\s*$', '', size).strip()
+            size = size.rstrip(self.TRAILING_OPTION_SYMBOLS).strip()
         
         return color, size
 
     def find_similar_products_for_failed_matches(self, failed_products: List[Dict]) -> pd.DataFrame:
         """매칭 실패한 상품들에 대해 유사도 기반 매칭 수행 - 성능 최적화"""
-        import time
         start_time = time.time()
         
         logger.info(f"매칭 실패 상품 {len(failed_products)}개에 대해 유사도 매칭 시작")
@@ -957,174 +1365,273 @@ class BrandMatchingSystem:
         results = []
         total_failed = len(failed_products)
         
-        for i, failed_product in enumerate(failed_products):
-            # 진행률 표시 (10개마다)
-            if i % 10 == 0 and i > 0:
-                elapsed = time.time() - start_time
-                progress = (i / total_failed) * 100
-                logger.info(f"유사도 매칭 진행률: {i}/{total_failed} ({progress:.1f}%) - 경과시간: {elapsed:.1f}초")
+        # ⚡ 실패 상품 목록을 컬럼 배열로 한 번에 변환 (행마다 dict 조회/strip 반복 방지)
+        failed_df = pd.DataFrame(failed_products)
+        brands = self._failed_column(failed_df, '브랜드')
+        products = self._failed_column(failed_df, '상품명')
+        colors = self._failed_column(failed_df, '색상')
+        sizes = self._failed_column(failed_df, '사이즈')
+        brands_lower = [sys.intern(brand.lower()) for brand in brands]
+        
+        # ⚡ 상품명 유사도 일괄 계산: 브랜드별로 (실패 상품 × 후보 상품) 행렬을 cdist 한 번에 계산
+        normalized_queries = [self.normalize_product_name(product) for product in products]
+        failed_by_brand = {}
+        for i, brand_lower in enumerate(brands_lower):
+            if brand_lower in self.brand_index:
+                failed_by_brand.setdefault(brand_lower, []).append(i)
+        
+        candidate_rows = {}  # 실패 상품 위치 -> (후보 행 위치 목록, 후보별 상품명 유사도, 전체 카탈로그 검색 여부)
+        for brand_lower, failed_positions in failed_by_brand.items():
+            # 무한 루프 방지: 처리 개수 제한 (브랜드 카탈로그 순서로 앞쪽 30개만 평가)
+            brand_rows = self.brand_index[brand_lower]
+            candidate_indices = brand_rows[:30]
+            if len(brand_rows) > 30:
+                for i in failed_positions:
+                    logger.warning(f"⚠️  유사도 매칭 처리 개수 제한 (30개): {brands[i]} - {products[i][:30]}...")
+            similarity_matrix = self._string_similarity_matrix(
+                [normalized_queries[i] for i in failed_positions],
+                [self._bd_product_norm[idx] for idx in candidate_indices],
+                score_cutoff=0.3  # _score_one은 0.3 미만 후보를 평가하지 않음
+            )
+            for row, i in enumerate(failed_positions):
+                candidate_rows[i] = (candidate_indices, similarity_matrix[row], False)
+        
+        # ⚡ 브랜드가 없거나 인덱스에 없는 상품(브랜드 오타 등)은 전체 카탈로그에서 extractOne으로 가장 비슷한 상품 하나를 후보로
+        # (결과는 CATALOG_SIMILAR_STATUS로 구분하고, 종합 0.3 미만이면 기존처럼 결과에서 제외)
+        if self._catalog_choices:
+            for i, brand_lower in enumerate(brands_lower):
+                query = normalized_queries[i].lower().strip()
+                if i in candidate_rows or not query:
+                    continue
+                # 컷오프는 경계값 0.3이 빠지지 않도록 조금 낮춤 (0.3 미만은 _score_one에서 제외)
+                best = rf_process.extractOne(query, self._catalog_choices,
+                                             scorer=rf_levenshtein.normalized_similarity, score_cutoff=0.299)
+                if best is not None:
+                    _, similarity, position = best
+                    candidate_rows[i] = ([self._catalog_positions[position]], np.array([similarity]), True)
+        
+        score_jobs = [
+            (failed_product, brands[i], products[i], colors[i], sizes[i], *candidate_rows.get(i, (None, None, False)))
+            for i, failed_product in enumerate(failed_products)
+        ]
+        
+        # ⚡ 실패 상품이 많으면 후보 평가(GIL에 묶이는 파이썬 루프)를 joblib 프로세스 청크로 분산
+        parallel_scored = None
+        if JOBLIB_AVAILABLE and (os.cpu_count() or 1) > 1 and total_failed >= self.PARALLEL_SIMILAR_MIN_ROWS:
+            try:
+                # 순차 처리와 같은 10분 제한 - 넘기면 그때까지 끝난 상품 결과만 사용
+                parallel_scored = self._score_failed_parallel(score_jobs, start_time + 600)
+            except Exception as e:
+                logger.warning(f"병렬 유사도 매칭 실패, 순차 처리로 전환: {e}")
+                parallel_scored = None
+        
+        if parallel_scored is not None:
+            results = [result_row for result_row in parallel_scored if result_row is not None]
+        else:
+            # 순차 평가 - _score_one은 GIL을 잡는 파이썬 루프이고 유사도/자모/동의어 캐시를 공유하므로
+            # 스레드로 나누지 않음 (병렬 처리는 위의 프로세스 경로)
+            for i, job in enumerate(score_jobs):
+                # 진행률 표시 (10개마다)
+                if i % 10 == 0 and i > 0:
+                    elapsed = time.time() - start_time
+                    progress = (i / total_failed) * 100
+                    logger.info(f"유사도 매칭 진행률: {i}/{total_failed} ({progress:.1f}%) - 경과시간: {elapsed:.1f}초")
                 
-                # 타임아웃 체크 (10분)
-                if elapsed > 600:
-                    logger.error("유사도 매칭 타임아웃 (10분 초과)")
-                    break
-            logger.debug(f"유사도 매칭 진행: {i+1}/{len(failed_products)}")
+                    # 타임아웃 체크 (10분)
+                    if elapsed > 600:
+                        logger.error("유사도 매칭 타임아웃 (10분 초과)")
+                        break
             
-            # 실패한 상품 정보 추출
-            brand = failed_product.get('브랜드', '').strip()
-            product_name = failed_product.get('상품명', '').strip()
-            color = failed_product.get('색상', '').strip()
-            size = failed_product.get('사이즈', '').strip()
+                result_row = self._score_one(*job)
+                if result_row is not None:
+                    results.append(result_row)
+        
+        # 결과를 DataFrame으로 변환
+        result_df = pd.DataFrame(results)
+        
+        # 유사도 순으로 정렬
+        if not result_df.empty:
+            result_df = result_df.sort_values('종합_유사도', ascending=False)
+        
+        total_elapsed = time.time() - start_time
+        successful_matches, _ = self.count_similarity_results(result_df)
+        catalog_matches = len(result_df[result_df['매칭_상태'] == self.CATALOG_SIMILAR_STATUS]) if not result_df.empty else 0
+        logger.info(f"유사도 매칭 완료: {len(result_df)}개 결과 ({successful_matches}개 성공, 그중 전체검색 {catalog_matches}개) - 소요시간: {total_elapsed:.1f}초")
+        return result_df
+
+    @classmethod
+    def count_similarity_results(cls, similarity_df: pd.DataFrame) -> Tuple[int, int]:
+        """유사도 매칭 결과의 (성공, 매칭실패) 개수 - 성공은 브랜드 내 유사매칭과 전체검색 유사매칭 합계"""
+        if similarity_df.empty or '매칭_상태' not in similarity_df.columns:
+            return 0, 0
+        statuses = similarity_df['매칭_상태']
+        return int(statuses.isin(cls.SIMILAR_MATCHED_STATUSES).sum()), int((statuses == '매칭실패').sum())
+
+    @staticmethod
+    def _failed_column(failed_df: pd.DataFrame, column: str) -> np.ndarray:
+        """실패 상품 DataFrame 컬럼을 공백 제거된 문자열 배열로 (컬럼/값이 없으면 빈 문자열)"""
+        if column not in failed_df.columns:
+            return np.full(len(failed_df), '', dtype=object)
+        return failed_df[column].fillna('').map(str).str.strip().to_numpy(dtype=object)
+
+    def _score_chunk(self, jobs: List[Tuple]) -> List[Optional[Dict]]:
+        """_score_one 인자 묶음을 순서대로 평가 (프로세스 병렬 처리용)"""
+        return [self._score_one(*job) for job in jobs]
+
+    def _score_failed_parallel(self, jobs: List[Tuple], deadline: float) -> List[Optional[Dict]]:
+        """매칭 실패 상품 평가를 청크 단위로 프로세스 병렬 처리 - 입력 순서대로 결과 반환 (deadline을 넘기면 앞쪽 청크만)"""
+        n_jobs = os.cpu_count() or 1
+        chunks = self._split_chunks(jobs, n_jobs * 4)
+        
+        logger.info(f"⚡ 병렬 유사도 매칭: {len(jobs):,}개 상품을 {len(chunks)}개 청크로 {n_jobs}개 프로세스에서 처리")
+        return self._run_chunks_in_processes(_score_chunk_in_worker, chunks, deadline, "유사도 매칭")
+
+    def _score_one(self, failed_product: Dict, brand: str, product_name: str, color: str, size: str,
+                   candidate_indices: Optional[List[int]], product_similarities: np.ndarray,
+                   catalog_wide: bool = False) -> Optional[Dict]:
+        """매칭 실패 상품 하나의 최고 유사 상품 평가 (후보가 없으면 None)
+        
+        catalog_wide: 후보가 브랜드 인덱스가 아니라 전체 카탈로그 검색 결과인지 여부
+        """
+        
+        best_match = None
+        best_score = 0.0
+        
+        # 후보 없음: 브랜드가 인덱스에 없고 전체 카탈로그 검색에서도 찾지 못함
+        if not candidate_indices:
+            logger.debug(f"유사도 매칭 스킵: 브랜드 '{brand}' 후보 없음")
+            return None
+        
+        logger.debug(f"⚡ 유사도 매칭 대상: {len(candidate_indices)}개 상품")
+        
+        # 업로드 상품의 색상/사이즈 변형은 후보와 무관하므로 한 번만 계산
+        color_variants = self.parse_color_variants(color) if color else ()
+        size_variants = self.parse_size_variants(size) if size else ()
+        size_numbers = self._size_variant_numbers(size_variants)
+        
+        # 종합 점수에서 상품명 비중 (아래 가중평균과 동일) - 색상/사이즈 유사도는 최대 1.0이므로
+        # 후보의 종합 점수 상한 = 상품명 유사도 × 비중 + (1 - 비중)
+        if color and size:
+            product_weight = 0.6
+        elif color or size:
+            product_weight = 0.8
+        else:
+            product_weight = 1.0
+        
+        # 상품명 유사도 높은 후보부터 평가해 상한 가지치기로 일찍 종료
+        # (후보 집합은 카탈로그 순서 앞쪽 30개 그대로, 동점이면 카탈로그 순서가 앞선 후보 - 순서대로 평가한 결과와 동일)
+        candidate_order = np.argsort(-product_similarities, kind='stable')
+        
+        best_position = -1
+        processed_count = 0
+        row_start_time = time.time()
+        for position in candidate_order:
+            idx = candidate_indices[position]
+            processed_count += 1
             
-            # 상품명 정규화
-            normalized_product_name = self.normalize_product_name(product_name)
+            # 타임아웃 체크 (개별 상품당 5초)
+            if time.time() - row_start_time > 5:
+                logger.warning(f"⚠️  유사도 매칭 타임아웃 (5초): {brand} - {product_name[:30]}... ({processed_count}개 처리됨)")
+                break
             
-            best_match = None
-            best_score = 0.0
+            brand_brand = self._bd_brand_str[idx]
+            brand_product = self._bd_product_str[idx]
+            brand_options = self._bd_options[idx]
             
-            # ⚡ 속도 최적화: 브랜드 인덱스 활용 (row 데이터 직접 사용)
-            candidate_rows = []
-            if brand:
-                brand_lower = brand.lower()
-                candidate_rows = self.brand_index.get(brand_lower, [])
+            # 상품명 유사도 (일괄 계산 결과 사용)
+            product_similarity = float(product_similarities[position])
             
-            # 브랜드 없거나 인덱스에 없으면 스킵 (유사도 매칭은 제한적으로)
-            if not candidate_rows:
-                logger.debug(f"유사도 매칭 스킵: 브랜드 '{brand}' 인덱스에 없음")
-                continue
+            # 상품명 유사도가 너무 낮으면 종료 (임계값: 0.3, 이후 후보는 모두 더 낮음)
+            if product_similarity < 0.3:
+                break
             
-            # 너무 많으면 상위 50개로 제한
-            if len(candidate_rows) > 50:
-                candidate_rows = candidate_rows[:50]
+            # ⚡ 상한 가지치기: 이 후보(와 이후 후보)의 최대 종합 점수가 현재 최고보다 낮으면 종료
+            # (같을 수 있으면 동점 비교를 위해 계속 평가)
+            if product_similarity * product_weight + (1 - product_weight) + 1e-9 < best_score:
+                break
             
-            logger.debug(f"⚡ 유사도 매칭 대상: {len(candidate_rows)}개 상품")
+            # 색상/사이즈 유사도 계산
+            color_similarity = 0.0
+            size_similarity = 0.0
             
-            processed_count = 0
-            row_start_time = time.time()
-            for brand_row_dict in candidate_rows:
+            if color or size:
+                # 브랜드 상품의 색상/사이즈 변형 (인덱스 구축 시 미리 계산됨)
+                brand_color_variants = self._bd_color_variants[idx]
+                brand_size_variants = self._bd_size_variants[idx]
                 
-                processed_count += 1
-                
-                # 타임아웃 체크 (개별 상품당 5초)
-                if time.time() - row_start_time > 5:
-                    logger.warning(f"⚠️  유사도 매칭 타임아웃 (5초): {brand} - {product_name[:30]}... ({processed_count}개 처리됨)")
-                    break
+                if color and brand_color_variants:
+                    # 색상 변형들과 비교
+                    color_similarity = self._max_color_variant_similarity(color_variants, brand_color_variants)
                 
-                # 무한 루프 방지: 처리 개수 제한 (30개로 제한)
-                if processed_count > 30:
-                    logger.warning(f"⚠️  유사도 매칭 처리 개수 제한 (30개): {brand} - {product_name[:30]}...")
-                    break
-                
-                brand_brand = str(brand_row_dict.get('브랜드', '')).strip()
-                brand_product = str(brand_row_dict.get('상품명', '')).strip()
-                brand_options = str(brand_row_dict.get('옵션입력', '')).strip()
-                
-                # 상품명 유사도 계산
-                brand_normalized = self.normalize_product_name(brand_product)
-                product_similarity = self.calculate_string_similarity(normalized_product_name, brand_normalized)
-                
-                # 상품명 유사도가 너무 낮으면 스킵 (임계값: 0.3)
-                if product_similarity < 0.3:
-                    continue
-                
-                # 색상/사이즈 유사도 계산
-                color_similarity = 0.0
-                size_similarity = 0.0
-                
-                if color or size:
-                    # 브랜드 상품의 색상/사이즈 추출
-                    brand_color = self.extract_color(brand_options)
-                    brand_size = self.extract_size(brand_options)
-                    
-                    if color and brand_color:
-                        # 색상 변형들과 비교
-                        color_variants = self.parse_color_variants(color)
-                        brand_color_variants = self.parse_color_variants(brand_color)
-                        
-                        max_color_sim = 0.0
-                        for c1 in color_variants:
-                            for c2 in brand_color_variants:
-                                sim = self.calculate_color_similarity(c1, c2)
-                                max_color_sim = max(max_color_sim, sim)
-                        color_similarity = max_color_sim
-                    
-                    if size and brand_size:
-                        # 사이즈 변형들과 비교
-                        size_variants = self.parse_size_variants(size)
-                        brand_size_variants = self.parse_size_variants(brand_size)
-                        
-                        max_size_sim = 0.0
-                        for s1 in size_variants:
-                            for s2 in brand_size_variants:
-                                sim = self.calculate_size_similarity(s1, s2)
-                                max_size_sim = max(max_size_sim, sim)
-                        size_similarity = max_size_sim
-                
-                # 종합 유사도 계산 (가중평균)
-                # 상품명 60%, 색상 20%, 사이즈 20%
-                total_score = (product_similarity * 0.6 + 
-                              color_similarity * 0.2 + 
-                              size_similarity * 0.2)
-                
-                # 색상이나 사이즈가 없는 경우 상품명 비중 증가
-                if not color and not size:
-                    total_score = product_similarity
-                elif not color:
-                    total_score = product_similarity * 0.8 + size_similarity * 0.2
-                elif not size:
-                    total_score = product_similarity * 0.8 + color_similarity * 0.2
-                
-                # 최고 점수 업데이트
-                if total_score > best_score:
-                    best_score = total_score
-                    best_match = {
-                        'brand_brand': brand_brand,
-                        'brand_product': brand_product,
-                        'brand_wholesale': brand_row_dict.get('중도매', ''),
-                        'brand_supply': brand_row_dict.get('공급가', ''),
-                        'brand_options': brand_options,
-                        'product_similarity': product_similarity,
-                        'color_similarity': color_similarity,
-                        'size_similarity': size_similarity,
-                        'total_score': total_score
-                    }
+                if size and brand_size_variants:
+                    # 사이즈 변형들과 비교
+                    size_similarity = self._max_size_variant_similarity(
+                        size_variants, brand_size_variants, size_numbers, self._bd_size_variant_numbers[idx]
+                    )
             
-            # 결과 저장
-            result_row = {
-                '원본_브랜드': brand,
-                '원본_상품명': product_name,
-                '원본_색상': color,
-                '원본_사이즈': size,
-                '유사상품_브랜드': best_match['brand_brand'] if best_match else '',
-                '유사상품_상품명': best_match['brand_product'] if best_match else '',
-                '유사상품_중도매': best_match['brand_wholesale'] if best_match else '',
-                '유사상품_공급가': best_match['brand_supply'] if best_match else '',
-                '유사상품_옵션': best_match['brand_options'] if best_match else '',
-                '상품명_유사도': f"{best_match['product_similarity']:.3f}" if best_match else '0.000',
-                '색상_유사도': f"{best_match['color_similarity']:.3f}" if best_match else '0.000',
-                '사이즈_유사도': f"{best_match['size_similarity']:.3f}" if best_match else '0.000',
-                '종합_유사도': f"{best_match['total_score']:.3f}" if best_match else '0.000',
-                '매칭_상태': '유사매칭' if best_match and best_match['total_score'] >= 0.3 else '매칭실패'
-            }
+            # 종합 유사도 계산 (가중평균)
+            # 상품명 60%, 색상 20%, 사이즈 20%
+            total_score = (product_similarity * 0.6 + 
+                          color_similarity * 0.2 + 
+                          size_similarity * 0.2)
             
-            # 원본 데이터의 다른 컬럼들도 추가
-            for key, value in failed_product.items():
-                if key not in result_row:
-                    result_row[f'원본_{key}'] = value
+            # 색상이나 사이즈가 없는 경우 상품명 비중 증가
+            if not color and not size:
+                total_score = product_similarity
+            elif not color:
+                total_score = product_similarity * 0.8 + size_similarity * 0.2
+            elif not size:
+                total_score = product_similarity * 0.8 + color_similarity * 0.2
             
-            results.append(result_row)
+            # 최고 점수 업데이트 (동점이면 카탈로그 순서가 앞선 후보)
+            if total_score > best_score or (best_match is not None and total_score == best_score
+                                            and position < best_position):
+                best_score = total_score
+                best_position = position
+                best_match = {
+                    'brand_brand': brand_brand,
+                    'brand_product': brand_product,
+                    'brand_wholesale': self._bd_wholesale[idx],
+                    'brand_supply': self._bd_supply[idx],
+                    'brand_options': brand_options,
+                    'product_similarity': product_similarity,
+                    'color_similarity': color_similarity,
+                    'size_similarity': size_similarity,
+                    'total_score': total_score
+                }
         
-        # 결과를 DataFrame으로 변환
-        result_df = pd.DataFrame(results)
+        # 전체 카탈로그 검색 후보는 유사매칭일 때만 별도 상태로 결과에 추가
+        if catalog_wide:
+            if not best_match or best_match['total_score'] < 0.3:
+                return None
+            match_status = self.CATALOG_SIMILAR_STATUS
+        else:
+            match_status = '유사매칭' if best_match and best_match['total_score'] >= 0.3 else '매칭실패'
+        
+        # 결과 저장
+        result_row = {
+            '원본_브랜드': brand,
+            '원본_상품명': product_name,
+            '원본_색상': color,
+            '원본_사이즈': size,
+            '유사상품_브랜드': best_match['brand_brand'] if best_match else '',
+            '유사상품_상품명': best_match['brand_product'] if best_match else '',
+            '유사상품_중도매': best_match['brand_wholesale'] if best_match else '',
+            '유사상품_공급가': best_match['brand_supply'] if best_match else '',
+            '유사상품_옵션': best_match['brand_options'] if best_match else '',
+            '상품명_유사도': f"{best_match['product_similarity']:.3f}" if best_match else '0.000',
+            '색상_유사도': f"{best_match['color_similarity']:.3f}" if best_match else '0.000',
+            '사이즈_유사도': f"{best_match['size_similarity']:.3f}" if best_match else '0.000',
+            '종합_유사도': f"{best_match['total_score']:.3f}" if best_match else '0.000',
+            '매칭_상태': match_status
+        }
         
-        # 유사도 순으로 정렬
-        if not result_df.empty:
-            result_df = result_df.sort_values('종합_유사도', ascending=False)
+        # 원본 데이터의 다른 컬럼들도 추가
+        for key, value in failed_product.items():
+            if key not in result_row:
+                result_row[f'원본_{key}'] = value
         
-        total_elapsed = time.time() - start_time
-        successful_matches = len(result_df[result_df['매칭_상태'] == '유사매칭']) if not result_df.empty else 0
-        logger.info(f"유사도 매칭 완료: {len(result_df)}개 결과 ({successful_matches}개 성공) - 소요시간: {total_elapsed:.1f}초")
-        return result_df
+        return result_row
 
     def _process_batch(self, batch_data):
         """배치 데이터 처리 (병렬 처리용)"""
@@ -1140,9 +1647,96 @@ class BrandMatchingSystem:
         # (실제 구현은 기존 로직과 동일)
         pass
     
+    @staticmethod
+    def _is_present(value) -> bool:
+        """pd.notna와 같은 결측 판정을 스칼라에 대해 pandas 호출 없이 수행"""
+        return value is not None and value is not pd.NA and value is not pd.NaT and value == value
+
+    @staticmethod
+    def _column_to_str(column: pd.Series) -> pd.Series:
+        """업로드 컬럼 전체를 문자열로 변환 (결측은 빈 문자열, 셀 단위 str()과 동일한 결과)"""
+        if isinstance(column.dtype, pd.StringDtype):
+            # 이미 문자열 컬럼이면 str() 호출 없이 결측만 채움
+            return column.fillna('')
+        return column.map(str).where(column.notna(), '')
+
+    @classmethod
+    def _quantity_column(cls, column: pd.Series) -> list:
+        """업로드 수량 컬럼 전체를 정수 리스트로 (결측/변환 실패는 1) - 숫자 컬럼은 셀 단위 변환 없이 일괄 처리"""
+        values = column.to_numpy()
+        if values.dtype.kind in 'iu':
+            return values.tolist()
+        if values.dtype.kind == 'f':
+            finite = np.isfinite(values)
+            # int64 범위 안이면 int()와 같은 0 방향 절삭, NaN/inf는 int() 실패와 같게 1
+            if np.all(np.abs(values[finite]) < 2.0 ** 63):
+                return np.where(finite, values, 1).astype(np.int64).tolist()
+        return [cls._to_quantity(value) for value in column.to_numpy(dtype=object)]
+
+    @classmethod
+    def _to_quantity(cls, value) -> int:
+        """수량 셀을 정수로 변환 (결측/변환 실패는 1)"""
+        try:
+            return int(value) if cls._is_present(value) else 1
+        except:
+            return 1
+
+    def _clean_product_name(self, raw_product_name: str) -> str:
+        """상품명에 키워드 제거 적용 - 결과가 너무 짧으면 원본에서 괄호 키워드만 제거"""
+        cleaned_product_name = self.normalize_product_name(raw_product_name)
+        if len(cleaned_product_name) < 2:
+            cleaned_product_name = self._strip_parenthesized_keywords(raw_product_name)
+        return cleaned_product_name
+
+    @staticmethod
+    def _quantity_to_int(value) -> int:
+        """주문 수량을 int()로 변환 (변환 실패는 0)"""
+        try:
+            return int(value)
+        except (TypeError, ValueError, OverflowError):
+            return 0
+
+    @staticmethod
+    def _map_unique(values: pd.Series, func) -> pd.Series:
+        """func를 행마다가 아니라 고유값마다 한 번만 호출하고 결과를 dict로 매핑 (중복이 많은 업로드 컬럼용)"""
+        unique_values = pd.unique(values)
+        return values.map(dict(zip(unique_values, map(func, unique_values))))
+
+    def _split_brand_product(self, e_values: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        """업로드 E열 전체를 브랜드/상품명 컬럼으로 분할 (상품명에 키워드 제거 적용)"""
+        brands = pd.Series('', index=e_values.index, dtype=object)
+        products = pd.Series('', index=e_values.index, dtype=object)
+        
+        # 괄호를 이용한 브랜드 추출 (예: 클라레오(기린) 상품명)
+        bracket_parts = e_values.str.extract(self._compiled_patterns['brand_bracket_split'])
+        has_bracket = bracket_parts[0].notna()
+        brands[has_bracket] = bracket_parts.loc[has_bracket, 0].str.strip()
+        products[has_bracket] = self._map_unique(bracket_parts.loc[has_bracket, 1].str.strip(), self._clean_product_name)
+        
+        # 일반적인 띄어쓰기 분할
+        has_space = ~has_bracket & e_values.str.contains(' ', regex=False)
+        if has_space.any():
+            space_parts = e_values[has_space].str.partition(' ')
+            first_parts = space_parts[0].str.strip()
+            has_first = first_parts != ''
+            split_index = first_parts.index[has_first]
+            brands[split_index] = first_parts[has_first]
+            products[split_index] = self._map_unique(space_parts.loc[has_first, 2].str.strip(), self._clean_product_name)
+        
+            # 첫 번째 부분이 비어있으면 전체를 상품명으로 처리
+            whole_index = first_parts.index[~has_first]
+            if len(whole_index):
+                whole_values = e_values[whole_index]
+                normalized = self._map_unique(whole_values, self.normalize_product_name)
+                products[whole_index] = normalized.where(normalized.str.len() >= 2, whole_values)
+        
+        # 띄어쓰기가 없으면 전체를 브랜드로 처리
+        brand_only = ~has_bracket & ~has_space & (e_values != '')
+        brands[brand_only] = e_values[brand_only]
+        return brands, products
+
     def convert_sheet1_to_sheet2(self, sheet1_df: pd.DataFrame) -> pd.DataFrame:
-        """Sheet1 형식을 Sheet2 형식으로 변환 - 성능 최적화 버전"""
-        import time
+        """Sheet1 형식을 Sheet2 형식으로 변환 - 컬럼 단위 벡터화 버전"""
         start_time = time.time()
         
         logger.info(f"Sheet1 -> Sheet2 변환 시작: {len(sheet1_df):,}개 행 처리")
@@ -1160,163 +1754,76 @@ class BrandMatchingSystem:
             logger.warning("업로드된 데이터가 없습니다")
             return pd.DataFrame(columns=sheet2_columns)
 
-        # 리스트로 모든 행 데이터를 수집 (성능 최적화)
-        sheet2_rows = []
         total_rows = len(sheet1_df)
+        column_count = len(sheet1_df.columns)
+        # ⚡ 행 단위 루프 없이 Sheet2 컬럼 전체를 한 번에 생성 (기본값은 빈 문자열)
+        sheet2_data = {col: [""] * total_rows for col in sheet2_columns}
+        
+        def upload_column(k: int) -> pd.Series:
+            return self._column_to_str(sheet1_df.iloc[:, k].reset_index(drop=True))
+        
+        # 직접 매핑
+        if column_count >= 1:  # 업로드 A열 → Sheet2 C열 (주문일)
+            sheet2_data['C열(주문일)'] = upload_column(0).tolist()
+        
+        if column_count >= 2:  # 업로드 B열 → Sheet2 D열 (아이디/주문번호)
+            sheet2_data['D열(아이디주문번호)'] = upload_column(1).tolist()
+        
+        if column_count >= 3:  # 업로드 C열 → Sheet2 F열 (주문자명)
+            sheet2_data['F열(주문자명)'] = upload_column(2).tolist()
+        
+        # 주소에서 3번째 단어 추출 (K열이 주소) - G열/R열 공통
+        address_third_words = None
+        if column_count >= 11:
+            address_third_words = self._map_unique(upload_column(10), self.extract_third_word_from_address)
+        
+        def with_address(names: pd.Series) -> list:
+            if address_third_words is None:
+                return names.tolist()
+            has_both = (names != '') & (address_third_words != '')
+            return names.where(~has_both, names + '(' + address_third_words + ')').tolist()
+        
+        # 업로드 D열 → Sheet2 G열 (위탁자명) + 주소 3번째 단어 추가
+        if column_count >= 4:
+            sheet2_data['G열(위탁자명)'] = with_address(upload_column(3))
+        
+        # 업로드 E열 → 브랜드/상품명 분할 (상품명에 키워드 제거 적용)
+        if column_count >= 5:
+            brands, products = self._split_brand_product(upload_column(4).str.strip())
+            sheet2_data['H열(브랜드)'] = brands.tolist()
+            sheet2_data['I열(상품명)'] = products.tolist()
+        
+        # 업로드 F열 (옵션) → 색상/사이즈 추출 (⚡ 같은 옵션 문자열은 한 번만 파싱)
+        if column_count >= 6:
+            parsed_options = self._map_unique(upload_column(5), self.parse_options)
+            sheet2_data['J열(색상)'] = [color for color, _ in parsed_options]
+            sheet2_data['K열(사이즈)'] = [size for _, size in parsed_options]
+        
+        if column_count >= 7:  # 업로드 G열 → Sheet2 L열 (수량)
+            sheet2_data['L열(수량)'] = self._quantity_column(sheet1_df.iloc[:, 6])
+        
+        # 업로드 H열 → Sheet2 M열 (옵션가) - 새로 추가
+        if column_count >= 8:
+            sheet2_data['M열(옵션가)'] = upload_column(7).tolist()
+        
+        # 업로드 I열 → Sheet2 R열 (이름) + 주소 3번째 단어 추가
+        if column_count >= 9:
+            sheet2_data['R열(이름)'] = with_address(upload_column(8))
+        
+        if column_count >= 10:  # 업로드 J열 → Sheet2 S열 (전화번호)
+            sheet2_data['S열(전화번호)'] = upload_column(9).tolist()
+        
+        if column_count >= 11:  # 업로드 K열 → Sheet2 T열 (주소)
+            sheet2_data['T열(주소)'] = upload_column(10).tolist()
+        
+        if column_count >= 12:  # 업로드 L열 → Sheet2 V열 (배송메세지)
+            sheet2_data['V열(배송메세지)'] = upload_column(11).tolist()
+        
+        # 매칭 결과는 나중에 채움
+        sheet2_data['O열(도매가격)'] = [0] * total_rows
+        sheet2_data['W열(금액)'] = [0] * total_rows
 
-        # Sheet1의 데이터를 Sheet2로 매핑
-        for i, (idx, row) in enumerate(sheet1_df.iterrows()):
-            # 진행률 표시 (1000개마다)
-            if i % 1000 == 0 and i > 0:
-                elapsed = time.time() - start_time
-                progress = (i / total_rows) * 100
-                logger.info(f"변환 진행률: {i:,}/{total_rows:,} ({progress:.1f}%) - 경과시간: {elapsed:.1f}초")
-                
-                # 타임아웃 체크 (10분)
-                if elapsed > 600:
-                    logger.error("데이터 변환 타임아웃 (10분 초과)")
-                    break
-            sheet2_row = {}
-            
-            # 기본값 설정
-            for col in sheet2_columns:
-                sheet2_row[col] = ""
-            
-            # 직접 매핑
-            if len(sheet1_df.columns) >= 1:  # 업로드 A열 → Sheet2 C열 (주문일)
-                sheet2_row['C열(주문일)'] = str(row.iloc[0]) if pd.notna(row.iloc[0]) else ""
-            
-            if len(sheet1_df.columns) >= 2:  # 업로드 B열 → Sheet2 D열 (아이디/주문번호)
-                sheet2_row['D열(아이디주문번호)'] = str(row.iloc[1]) if pd.notna(row.iloc[1]) else ""
-            
-            if len(sheet1_df.columns) >= 3:  # 업로드 C열 → Sheet2 F열 (주문자명)
-                sheet2_row['F열(주문자명)'] = str(row.iloc[2]) if pd.notna(row.iloc[2]) else ""
-            
-            # 업로드 D열 → Sheet2 G열 (위탁자명) + 주소 3번째 단어 추가
-            if len(sheet1_df.columns) >= 4:
-                name = str(row.iloc[3]) if pd.notna(row.iloc[3]) else ""
-                # 주소에서 3번째 단어 추출 (K열이 주소)
-                address_third_word = ""
-                if len(sheet1_df.columns) >= 11:  # K열(주소)이 있으면
-                    address = str(row.iloc[10]) if pd.notna(row.iloc[10]) else ""
-                    address_third_word = self.extract_third_word_from_address(address)
-                
-                if name and address_third_word:
-                    sheet2_row['G열(위탁자명)'] = f"{name}({address_third_word})"
-                else:
-                    sheet2_row['G열(위탁자명)'] = name
-            
-            # 업로드 E열 → 브랜드/상품명 분할 (상품명에 키워드 제거 적용)
-            if len(sheet1_df.columns) >= 5:
-                e_value = str(row.iloc[4]) if pd.notna(row.iloc[4]) else ""
-                e_value = e_value.strip()  # 앞뒤 공백 제거
-                
-                if e_value:
-                    # 괄호를 이용한 브랜드 추출 시도 (예: 클라레오(기린) 상품명)
-                    bracket_match = re.match(r'^([^)]+\)[^)]*?)\s+(.+)$', e_value)
-                    if bracket_match:
-                        # 괄호가 포함된 브랜드명과 상품명 분리
-                        brand_part = bracket_match.group(1).strip()
-                        product_part = bracket_match.group(2).strip()
-                        sheet2_row['H열(브랜드)'] = brand_part
-                        
-                        # 상품명에 키워드 제거 적용
-                        cleaned_product_name = self.normalize_product_name(product_part)
-                        if len(cleaned_product_name) < 2:
-                            # 원본에서 괄호만 제거
-                            cleaned_product_name = product_part
-                            for keyword in self.keyword_list:
-                                if keyword:
-                                    pattern = r'\(' + re.escape(keyword) + r'\)'
-                                    cleaned_product_name = re.sub(pattern, '', cleaned_product_name, flags=re.IGNORECASE)
-                            cleaned_product_name = re.sub(r'\s+', ' ', cleaned_product_name).strip()
-                        
-                        sheet2_row['I열(상품명)'] = cleaned_product_name
-                        
-                    elif ' ' in e_value:
-                        # 일반적인 띄어쓰기 분할 (공백 제거 후)
-                        parts = e_value.split(' ', 1)
-                        if parts[0].strip():  # 첫 번째 부분이 비어있지 않으면
-                            sheet2_row['H열(브랜드)'] = parts[0].strip()
-                            # 상품명에 키워드 제거 적용
-                            raw_product_name = parts[1].strip() if len(parts) > 1 else ""
-                            if raw_product_name:
-                                cleaned_product_name = self.normalize_product_name(raw_product_name)
-                                if len(cleaned_product_name) < 2:
-                                    # 원본에서 괄호만 제거
-                                    cleaned_product_name = raw_product_name
-                                    for keyword in self.keyword_list:
-                                        if keyword:
-                                            pattern = r'\(' + re.escape(keyword) + r'\)'
-                                            cleaned_product_name = re.sub(pattern, '', cleaned_product_name, flags=re.IGNORECASE)
-                                    cleaned_product_name = re.sub(r'\s+', ' ', cleaned_product_name).strip()
-                                
-                                sheet2_row['I열(상품명)'] = cleaned_product_name
-                            else:
-                                sheet2_row['I열(상품명)'] = ""
-                        else:
-                            # 첫 번째 부분이 비어있으면 전체를 상품명으로 처리
-                            sheet2_row['H열(브랜드)'] = ""
-                            cleaned_product_name = self.normalize_product_name(e_value)
-                            if len(cleaned_product_name) < 2:
-                                cleaned_product_name = e_value
-                            sheet2_row['I열(상품명)'] = cleaned_product_name
-                    else:
-                        # 띄어쓰기가 없으면 전체를 브랜드로 처리
-                        sheet2_row['H열(브랜드)'] = e_value
-                        sheet2_row['I열(상품명)'] = ""
-                else:
-                    sheet2_row['H열(브랜드)'] = ""
-                    sheet2_row['I열(상품명)'] = ""
-            
-            # 업로드 F열 (옵션) → 색상/사이즈 추출
-            if len(sheet1_df.columns) >= 6:
-                f_value = str(row.iloc[5]) if pd.notna(row.iloc[5]) else ""
-                sheet2_row['J열(색상)'], sheet2_row['K열(사이즈)'] = self.parse_options(f_value)
-            
-            if len(sheet1_df.columns) >= 7:  # 업로드 G열 → Sheet2 L열 (수량)
-                try:
-                    sheet2_row['L열(수량)'] = int(row.iloc[6]) if pd.notna(row.iloc[6]) else 1
-                except:
-                    sheet2_row['L열(수량)'] = 1
-            
-            # 업로드 H열 → Sheet2 M열 (옵션가) - 새로 추가
-            if len(sheet1_df.columns) >= 8:
-                sheet2_row['M열(옵션가)'] = str(row.iloc[7]) if pd.notna(row.iloc[7]) else ""
-            
-            # 업로드 I열 → Sheet2 R열 (이름) + 주소 3번째 단어 추가
-            if len(sheet1_df.columns) >= 9:
-                name = str(row.iloc[8]) if pd.notna(row.iloc[8]) else ""
-                # 주소에서 3번째 단어 추출 (K열이 주소)
-                address_third_word = ""
-                if len(sheet1_df.columns) >= 11:  # K열(주소)이 있으면
-                    address = str(row.iloc[10]) if pd.notna(row.iloc[10]) else ""
-                    address_third_word = self.extract_third_word_from_address(address)
-                
-                if name and address_third_word:
-                    sheet2_row['R열(이름)'] = f"{name}({address_third_word})"
-                else:
-                    sheet2_row['R열(이름)'] = name
-            
-            if len(sheet1_df.columns) >= 10:  # 업로드 J열 → Sheet2 S열 (전화번호)
-                sheet2_row['S열(전화번호)'] = str(row.iloc[9]) if pd.notna(row.iloc[9]) else ""
-            
-            if len(sheet1_df.columns) >= 11:  # 업로드 K열 → Sheet2 T열 (주소)
-                sheet2_row['T열(주소)'] = str(row.iloc[10]) if pd.notna(row.iloc[10]) else ""
-            
-            if len(sheet1_df.columns) >= 12:  # 업로드 L열 → Sheet2 V열 (배송메세지)
-                sheet2_row['V열(배송메세지)'] = str(row.iloc[11]) if pd.notna(row.iloc[11]) else ""
-            
-            # 매칭 결과는 나중에 채움
-            sheet2_row['N열(중도매명)'] = ""
-            sheet2_row['O열(도매가격)'] = 0
-            sheet2_row['W열(금액)'] = 0
-            
-            # 리스트에 추가 (성능 최적화)
-            sheet2_rows.append(sheet2_row)
-
-        # 모든 행을 한 번에 DataFrame으로 생성 (성능 최적화)
-        sheet2_df = pd.DataFrame(sheet2_rows, columns=sheet2_columns)
+        sheet2_df = pd.DataFrame(sheet2_data, columns=sheet2_columns)
         
         total_elapsed = time.time() - start_time
         logger.info(f"Sheet2 변환 완료: {len(sheet2_df):,}개 행 - 소요시간: {total_elapsed:.1f}초")
@@ -1324,12 +1831,12 @@ class BrandMatchingSystem:
 
     def extract_size(self, text: str) -> str:
         """사이즈{...} 패턴에서 사이즈 추출 (브랜드매칭시트용)"""
-        if pd.isna(text):
+        if not self._is_present(text):
             return ""
 
         # 브랜드매칭시트의 실제 패턴: 색상{...}//사이즈{...}
         # 또는 기존 패턴: 사이즈{...}
-        size_match = re.search(r"사이즈\{([^}]*)\}", str(text))
+        size_match = self._compiled_patterns['size_block'].search(str(text))
         if size_match:
             size_content = size_match.group(1).strip().lower()
             # | 또는 \ 기호를 공백으로 변환하여 검색하기 쉽게 만듦
@@ -1340,11 +1847,11 @@ class BrandMatchingSystem:
 
     def extract_color(self, text: str) -> str:
         """색상{...} 패턴에서 색상 추출 (브랜드매칭시트용)"""
-        if pd.isna(text):
+        if not self._is_present(text):
             return ""
 
         # 브랜드매칭시트의 패턴: 색상{...}//사이즈{...}
-        color_match = re.search(r"색상\{([^}]*)\}", str(text))
+        color_match = self._compiled_patterns['color_block'].search(str(text))
         if color_match:
             color_content = color_match.group(1).strip().lower()
             # | 또는 \ 기호를 공백으로 변환하여 검색하기 쉽게 만듦
@@ -1355,7 +1862,6 @@ class BrandMatchingSystem:
 
     def match_row(self, brand: str, product: str, size: str, color: str = "") -> Tuple[str, str, str, bool]:
         """브랜드, 상품명, 사이즈, 색상으로 매칭하여 공급가, 중도매, 브랜드+상품명, 매칭성공여부 반환"""
-        import time
         start_time = time.time()
         
         # 빠른 실패: 빈 값 체크
@@ -1381,22 +1887,43 @@ class BrandMatchingSystem:
             return "매칭 실패", "", "", False
 
         # ⚡ 속도 최적화: 브랜드 인덱스 활용 (row 데이터 직접 사용)
-        brand_lower = brand.lower()
-        candidate_rows = self.brand_index.get(brand_lower, [])
+        brand_lower = sys.intern(brand.lower())
+        candidate_indices = self.brand_index.get(brand_lower, [])
         
-        if not candidate_rows:
+        if not candidate_indices:
             logger.debug(f"브랜드 '{brand}' 인덱스에 없음")
             return "매칭 실패", "", "", False
         
-        logger.debug(f"⚡ 브랜드 '{brand}' 인덱스 검색 결과: {len(candidate_rows)}개 상품")
+        logger.debug(f"⚡ 브랜드 '{brand}' 인덱스 검색 결과: {len(candidate_indices)}개 상품")
+        
+        # ⚡ 정확 일치 프로브: 정규화 상품명이 같은 상품은 전체 탐색에서도 유사도 100으로 앞순위이므로
+        # 같은 이름의 행 전체(옵션만 다른 행 포함)를 브랜드 인덱스 순서로 함께 평가해서
+        # 종합 92% 이상인 행이 있으면 유사도 탐색 없이 바로 반환 (없으면 아래 전체 탐색으로 진행)
+        exact_indices = self._exact_product_index.get((brand_lower, normalized_product.lower().strip()))
+        if exact_indices:
+            exact_candidates = [{'idx': idx, 'product_similarity': 100.0} for idx in exact_indices]
+            position, similarity = self._score_top_candidates(exact_candidates, size, color)
+            if position >= 0 and similarity >= 92:
+                return self._matched_row_result(exact_indices[position])
 
         # ⚡ 유사도 매칭: 2단계 접근
         # 1단계: 상품명 유사도만 빠르게 계산하여 후보 선정
         product_candidates = []
         processed_count = 0
         
-        # ⚡ row 데이터를 직접 사용 (iloc 완전 제거!)
-        for row_dict in candidate_rows:
+        # ⚡ 길이 비율 사전 필터: 길이 비율 0.7 미만 후보는 유사도 계산 전에 정수 길이 비교만으로 제외
+        query_length = len(normalized_product)
+        candidate_lengths = self._bd_product_norm_len[candidate_indices]
+        longer = np.maximum(candidate_lengths, query_length)
+        keep = (longer > 0) & (np.minimum(candidate_lengths, query_length) / np.maximum(longer, 1) >= 0.7)
+        
+        # ⚡ rapidfuzz 사전 필터: 상한값이 85% 미만인 후보는 후보별 유사도 계산 없이 제외 (결과 동일)
+        if brand_lower in self._brand_similarity_forms:
+            keep &= self._similarity_upper_bounds(brand_lower, normalized_product) >= 84.99
+        candidate_indices = np.asarray(candidate_indices)[keep].tolist()
+        
+        # ⚡ 컬럼 배열을 직접 사용 (iloc 완전 제거!)
+        for idx in candidate_indices:
             processed_count += 1
             
             # 타임아웃 체크 (1단계는 빠르므로 1초로 단축)
@@ -1405,8 +1932,7 @@ class BrandMatchingSystem:
                 break
             
             # 1단계: 상품명 유사도만 빠르게 계산
-            row_product_raw = str(row_dict.get('상품명', '')).strip()
-            row_product = self.normalize_product_name(row_product_raw)
+            row_product = self._bd_product_norm[idx]
             product_similarity = self.calculate_similarity(normalized_product, row_product)
             
             # 상품명 유사도가 너무 낮으면 스킵 (85%로 강화하여 정확도 향상)
@@ -1414,17 +1940,9 @@ class BrandMatchingSystem:
             if product_similarity < 85:
                 continue
             
-            # 길이 비율 체크
-            min_len = min(len(normalized_product), len(row_product))
-            max_len = max(len(normalized_product), len(row_product))
-            length_ratio = min_len / max_len if max_len > 0 else 0
-            
-            if length_ratio < 0.7:
-                continue
-            
             # 후보로 추가 (상품명 유사도와 함께 저장)
             product_candidates.append({
-                'row_dict': row_dict,
+                'idx': idx,
                 'product_similarity': product_similarity,
                 'row_product': row_product
             })
@@ -1434,98 +1952,133 @@ class BrandMatchingSystem:
             logger.debug(f"❌ 매칭 실패: 상품명 유사도 70% 이상 후보 없음")
             return "매칭 실패", "", "", False
         
-        # 2단계: 상품명 유사도 높은 순으로 정렬 후 상위 5개만 상세 평가
-        product_candidates.sort(key=lambda x: x['product_similarity'], reverse=True)
-        top_candidates = product_candidates[:5]  # 상위 5개만
+        # 2단계: 상품명 유사도 높은 순 상위 5개만 상세 평가
+        # ⚡ 전체 정렬 대신 nlargest로 상위 5개만 선택 (sorted(..., reverse=True)[:5]와 같은 순서)
+        top_candidates = heapq.nlargest(5, product_candidates, key=lambda x: x['product_similarity'])
         
         logger.debug(f"⚡ 1단계 완료: {len(product_candidates)}개 후보 중 상위 {len(top_candidates)}개 상세 평가")
         
-        # 2단계: 상위 후보들만 색상/사이즈 유사도 계산
-        best_match = None
-        best_similarity = 0.0
+        # 2단계: 상위 후보들만 색상/사이즈 유사도 계산 후 종합 유사도로 선택
+        best_position, best_similarity = self._score_top_candidates(top_candidates, size, color)
         
-        for candidate in top_candidates:
-            row_dict = candidate['row_dict']
-            product_similarity = candidate['product_similarity']
+        # 최고 유사도 매칭 결과 반환
+        if best_position >= 0 and best_similarity >= 60:
+            return self._matched_row_result(top_candidates[best_position]['idx'])
+
+        logger.debug(f"❌ 매칭 실패 (최고 유사도: {best_similarity:.1f}% < 60%)")
+        return "매칭 실패", "", "", False
+
+    def _score_top_candidates(self, top_candidates: List[Dict], size: str, color: str) -> Tuple[int, float]:
+        """상위 후보들의 색상/사이즈 유사도를 계산하고 종합 유사도로 최고 후보 선택 - (위치, 종합 유사도), 없으면 (-1, 0.0)"""
+        candidate_count = len(top_candidates)
+        product_similarities = np.empty(candidate_count, dtype=np.float64)
+        size_similarities = np.full(candidate_count, 100.0)
+        color_similarities = np.full(candidate_count, 100.0)
+        normalized_size = None  # 업로드 사이즈의 check_size_match용 정규화 값 (처음 필요할 때 한 번만 계산)
+        
+        for position, candidate in enumerate(top_candidates):
+            idx = candidate['idx']
+            product_similarities[position] = candidate['product_similarity']
             
             # 색상 유사도 계산
-            color_similarity = 100.0
             if color:
-                row_color_pattern = self.extract_color(str(row_dict.get('옵션입력', '')))
+                row_color_pattern = self._bd_color[idx]
                 if row_color_pattern:
-                    color_similarity = self.calculate_similarity(color, row_color_pattern)
+                    color_similarities[position] = self.calculate_similarity(color, row_color_pattern)
                 else:
-                    color_similarity = 0.0
+                    color_similarities[position] = 0.0
             
             # 사이즈 유사도 계산 (정확 매칭 강화)
-            size_similarity = 100.0
+            # 🚨 50% 미만은 커널에서 제외 - 목적: 주니어 사이즈 오매칭 방지 (S→JS, M→JM 등)
             if size:
-                row_size_pattern = self.extract_size(str(row_dict.get('옵션입력', '')))
+                row_size_pattern = self._bd_size[idx]
                 if row_size_pattern:
-                    size_similarity = self.check_size_match(size, row_size_pattern)
+                    if normalized_size is None:
+                        normalized_size = self.normalize_size_format(size.strip().upper())
+                    size_similarities[position] = self._check_normalized_size_match(normalized_size, row_size_pattern)
                 else:
-                    size_similarity = 0.0
-                
-                # 🚨 사이즈 임계값 체크 (50% 미만 차단)
-                # 목적: 주니어 사이즈 오매칭 방지 (S→JS, M→JM 등)
-                if size_similarity < 50:
-                    logger.debug(f"❌ 사이즈 유사도 너무 낮음: {size_similarity:.1f}% < 50% (업로드: {size}, 브랜드: {row_size_pattern})")
-                    continue  # 이 후보는 평가에서 제외
-            
-            # 가격 유사도 계산 (오매칭 방지)
-            # 참고: 업로드 파일에는 가격이 없으므로, 브랜드 시트 내 유사 상품 간 가격 비교
-            # 현재는 가격 정보를 활용하지 않지만, 향후 확장 가능
-            price_similarity = 50.0  # 중립 (가격 정보 없음)
-            
-            # 종합 유사도 계산 (가격 가중치 5% 추가)
-            total_similarity = (
-                product_similarity * 0.45 +  # 45% (기존 50%에서 조정)
-                size_similarity * 0.30 +      # 30%
-                color_similarity * 0.20 +     # 20%
-                price_similarity * 0.05       # 5% (향후 확장 가능)
-            )
-            
-            logger.debug(f"후보 평가: {row_dict.get('상품명', '')[:20]}... (상품={product_similarity:.1f}%, 사이즈={size_similarity:.1f}%, 색상={color_similarity:.1f}%, 종합={total_similarity:.1f}%)")
-            
-            # 종합 유사도가 60% 미만이면 스킵
-            if total_similarity < 60:
-                continue
-            
-            # 현재 후보 정보
-            공급가 = row_dict.get('공급가', 0)
-            중도매 = row_dict.get('중도매', '')
-            브랜드상품명 = f"{row_dict.get('브랜드', '')} {row_dict.get('상품명', '')}"
-            
-            # 92% 이상이면 즉시 리턴 (거의 완벽한 매칭 - 오매칭 방지)
-            if total_similarity >= 92:
-                logger.debug(f"✅ 높은 유사도 매칭 발견 ({total_similarity:.1f}%): {브랜드상품명} - 즉시 리턴!")
-                return 공급가, 중도매, 브랜드상품명, True
-            
-            # 최고 유사도 업데이트
-            if total_similarity > best_similarity:
-                best_similarity = total_similarity
-                best_match = {
-                    'similarity': total_similarity,
-                    '공급가': 공급가,
-                    '중도매': 중도매,
-                    '브랜드상품명': 브랜드상품명,
-                    'product_sim': product_similarity,
-                    'size_sim': size_similarity,
-                    'color_sim': color_similarity
-                }
+                    size_similarities[position] = 0.0
+        
+        # ⚡ 종합 유사도(상품 45% + 사이즈 30% + 색상 20% + 가격 중립 5%) 계산, 60% 미만 제외,
+        # 92% 이상이면 그 후보에서 즉시 종료, 아니면 최고 유사도 후보 선택
+        best_position, best_similarity = best_weighted_candidate(
+            product_similarities, size_similarities, color_similarities, bool(size)
+        )
+        if best_position >= 0:
+            logger.debug(f"   상세: 상품={product_similarities[best_position]:.1f}%, 사이즈={size_similarities[best_position]:.1f}%, 색상={color_similarities[best_position]:.1f}% (종합: {best_similarity:.1f}%)")
+        return best_position, best_similarity
 
-        # 최고 유사도 매칭 결과 반환
-        if best_match and best_similarity >= 60:
-            logger.debug(f"✅ 최종 매칭 선택: {best_match['브랜드상품명']} (유사도: {best_similarity:.1f}%)")
-            logger.debug(f"   상세: 상품={best_match['product_sim']:.1f}%, 사이즈={best_match['size_sim']:.1f}%, 색상={best_match['color_sim']:.1f}%")
-            return best_match['공급가'], best_match['중도매'], best_match['브랜드상품명'], True
+    def _matched_row_result(self, idx: int) -> Tuple[str, str, str, bool]:
+        """매칭된 브랜드 상품 행의 (공급가, 중도매, 브랜드+상품명, True)"""
+        브랜드상품명 = f"{self._bd_brand[idx]} {self._bd_product[idx]}"
+        logger.debug(f"✅ 최종 매칭 선택: {브랜드상품명}")
+        return self._bd_supply[idx], self._bd_wholesale[idx], 브랜드상품명, True
 
-        logger.debug(f"❌ 매칭 실패 (최고 유사도: {best_similarity:.1f}% < 60%)")
-        return "매칭 실패", "", "", False
+    def _match_chunk(self, rows: List[Tuple[str, str, str, str]]) -> List[Tuple]:
+        """(브랜드, 상품명, 사이즈, 색상) 묶음 매칭 - (공급가, 중도매, 브랜드상품명, 성공여부, 소요시간) 리스트 반환"""
+        matched = []
+        for brand, product, size, color in rows:
+            row_start_time = time.time()
+            try:
+                result = self.match_row(brand, product, size, color)
+            except Exception as e:
+                logger.error(f"매칭 중 오류: {e} (브랜드: {brand}, 상품: {product})")
+                result = ("매칭 실패", "", "", False)
+            matched.append(result + (time.time() - row_start_time,))
+        return matched
+
+    @staticmethod
+    def _split_chunks(items: list, max_chunks: int) -> List[list]:
+        """리스트를 최대 max_chunks개의 연속 구간으로 고르게 분할"""
+        chunk_count = min(len(items), max_chunks)
+        bounds = np.linspace(0, len(items), chunk_count + 1).astype(int)
+        return [items[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+
+    def _run_chunks_in_processes(self, worker, chunks: List[list], deadline: float, label: str) -> list:
+        """청크들을 loky 프로세스 풀에서 처리하고 입력 순서대로 결과를 이어붙여 반환
+        
+        매칭 시스템은 워커 initializer로 워커당 한 번만 피클하고 청크마다 행 데이터만 전달.
+        청크가 끝날 때마다 진행률을 기록하고, deadline(time.time() 기준)을 넘기면 남은 청크를 취소하고
+        워커를 종료한 뒤 그때까지 끝난 앞쪽 청크의 결과만 반환
+        """
+        n_jobs = min(os.cpu_count() or 1, len(chunks))
+        total = sum(len(chunk) for chunk in chunks)
+        start_time = time.time()
+        results = []
+        completed = False
+        
+        executor = LokyProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker_system, initargs=(self,))
+        futures = []
+        try:
+            futures = [executor.submit(worker, chunk) for chunk in chunks]
+            for future in futures:
+                try:
+                    results.extend(future.result(timeout=max(deadline - time.time(), 0)))
+                except concurrent.futures.TimeoutError:
+                    logger.error(f"{label} 타임아웃 - {len(results):,}/{total:,}개까지만 처리")
+                    break
+                elapsed = time.time() - start_time
+                logger.info(f"{label} 진행률: {len(results):,}/{total:,} ({len(results) / total * 100:.1f}%) - 경과시간: {elapsed:.1f}초")
+            else:
+                completed = True
+        finally:
+            # 타임아웃/오류 시 남은 청크는 기다리지 않고 워커를 종료
+            if not completed:
+                for future in futures:
+                    future.cancel()
+            executor.shutdown(wait=completed, kill_workers=not completed)
+        return results
+
+    def _match_rows_parallel(self, rows: List[Tuple[str, str, str, str]], deadline: float) -> List[Tuple]:
+        """행 묶음(청크) 단위로 프로세스 병렬 매칭 - deadline을 넘기면 앞쪽 청크 결과만 반환"""
+        n_jobs = os.cpu_count() or 1
+        chunks = self._split_chunks(rows, n_jobs * 4)
+        
+        logger.info(f"⚡ 병렬 매칭: {len(rows):,}개 행을 {len(chunks)}개 청크로 {n_jobs}개 프로세스에서 처리")
+        return self._run_chunks_in_processes(_match_chunk_in_worker, chunks, deadline, "병렬 매칭")
 
     def process_matching(self, sheet2_df: pd.DataFrame) -> Tuple[pd.DataFrame, List[Dict]]:
         """Sheet2 데이터에 대해 매칭 수행하고 매칭 실패한 상품들 반환"""
-        import time
         logger.info("매칭 처리 시작")
 
         if sheet2_df.empty:
@@ -1543,102 +2096,136 @@ class BrandMatchingSystem:
         # ⚡ 성능 개선: 결과를 리스트에 모았다가 한 번에 할당 (at 반복 사용 방지)
         results = {
             'N열(중도매명)': [''] * len(sheet2_df),
-            'O열(도매가격)': [0] * len(sheet2_df),
-            'W열(금액)': [0] * len(sheet2_df)
+            'O열(도매가격)': [0] * len(sheet2_df)
         }
         
-        # ⚡ 최고 속도: to_dict('records') 사용 (가장 빠름!)
-        rows_dict = sheet2_df.to_dict('records')
+        # ⚡ 행마다 dict를 만드는 to_dict('records') 대신 필요한 컬럼만 리스트로 한 번에 추출
+        def column_strings(column: str) -> List[str]:
+            if column not in sheet2_df.columns:
+                return [''] * total_count
+            return [str(value).strip() for value in sheet2_df[column].tolist()]
+        
+        brands = column_strings('H열(브랜드)')
+        products = column_strings('I열(상품명)')
+        sizes = column_strings('K열(사이즈)')
+        colors = column_strings('J열(색상)')
+        quantities = sheet2_df['L열(수량)'].tolist() if 'L열(수량)' in sheet2_df.columns else [1] * total_count
         indices = sheet2_df.index.tolist()
         
-        for current_index, (row_dict, idx) in enumerate(zip(rows_dict, indices)):
-            # 진행률 표시 (매 항목마다 - 즉시 출력)
-            elapsed_time = time.time() - start_time
-            progress = ((current_index + 1) / total_count) * 100
-            
-            # 매 항목마다 짧게 출력
-            print(f"\r진행: {current_index + 1}/{total_count} ({progress:.0f}%)", end='', flush=True)
-            
-            # 10개마다 상세 출력
-            if (current_index + 1) % 10 == 0:
-                avg_time = elapsed_time / (current_index + 1)
-                eta = avg_time * (total_count - current_index - 1)
-                print(f"\r진행률: {current_index + 1:,}/{total_count:,} ({progress:.1f}%) - 경과: {elapsed_time:.1f}초, 예상: {eta:.1f}초", flush=True)
-                
-                # 타임아웃 체크 (10분으로 단축)
-                if elapsed_time > 600:  # 10분
-                    logger.error("매칭 처리 타임아웃 (10분 초과) - 처리 중단")
-                    break
-            
-            # 브랜드, 상품명, 사이즈 추출
-            brand = str(row_dict.get('H열(브랜드)', '')).strip()
-            product = str(row_dict.get('I열(상품명)', '')).strip()
-            size = str(row_dict.get('K열(사이즈)', '')).strip()
-            color = str(row_dict.get('J열(색상)', '')).strip()
-            quantity = row_dict.get('L열(수량)', 1)
-
-            # 빈 값 체크
-            if not brand or not product:
-                results['N열(중도매명)'][current_index] = ""
-                results['O열(도매가격)'][current_index] = 0
-                results['W열(금액)'][current_index] = 0
-                continue
-
-            # 매칭 수행 (타임아웃 적용)
+        # ⚡ 같은 (브랜드, 상품명, 사이즈, 색상) 주문은 매칭 결과가 같으므로 조합별로 한 번만 매칭
+        # 키 -> (공급가, 중도매, 브랜드상품명, 성공여부) - 느림/시간 초과 판정은 처음 평가한 행에서만
+        matched_rows = {}
+        # 병렬 매칭 결과: 키 -> (공급가, 중도매, 브랜드상품명, 성공여부, 소요시간), 처음 쓰일 때 꺼냄
+        parallel_rows = {}
+        
+        # ⚡ 대량 입력은 고유 조합 매칭만 먼저 프로세스 병렬로 끝내고, 아래 루프는 결과 집계만 수행
+        if JOBLIB_AVAILABLE and (os.cpu_count() or 1) > 1 and total_count >= self.PARALLEL_MATCH_MIN_ROWS:
+            unique_rows = list(dict.fromkeys(
+                (brands[position], products[position], sizes[position], colors[position])
+                for position in range(total_count) if brands[position] and products[position]
+            ))
             try:
-                row_start_time = time.time()
-                공급가, 중도매, 브랜드상품명, success = self.match_row(brand, product, size, color)
-                row_elapsed = time.time() - row_start_time
+                # 아래 루프와 같은 10분 제한 - 넘기면 끝난 조합만 사용 (루프도 첫 묶음 후 타임아웃으로 중단)
+                parallel_rows = dict(zip(unique_rows, self._match_rows_parallel(unique_rows, start_time + 600)))
+            except Exception as e:
+                logger.warning(f"병렬 매칭 실패, 순차 처리로 전환: {e}")
+                parallel_rows = {}
+        
+        # ⚡ 진행률 출력/타임아웃 확인은 행마다가 아니라 PROGRESS_BATCH_SIZE 행 묶음마다 한 번
+        batch_size = self.PROGRESS_BATCH_SIZE
+        for batch_start in range(0, total_count, batch_size):
+            batch_end = min(batch_start + batch_size, total_count)
+            for current_index in range(batch_start, batch_end):
+                idx = indices[current_index]
                 
-                # 단일 행 처리가 3초를 초과하면 경고
-                if row_elapsed > 3:
-                    print(f"⚠️  행 {current_index} 느림: {row_elapsed:.1f}초", flush=True)
+                # 브랜드, 상품명, 사이즈 추출 (미리 변환한 컬럼 리스트에서 위치로 조회)
+                brand = brands[current_index]
+                product = products[current_index]
+                size = sizes[current_index]
+                color = colors[current_index]
+                quantity = quantities[current_index]
+
+                # 빈 값 체크
+                if not brand or not product:
+                    results['N열(중도매명)'][current_index] = ""
+                    results['O열(도매가격)'][current_index] = 0
+                    continue
+
+                # 매칭 수행 (타임아웃 적용)
+                try:
+                    match_key = (brand, product, size, color)
+                    matched_row = matched_rows.get(match_key)
+                    if matched_row is None:
+                        if match_key in parallel_rows:
+                            *matched_row, row_elapsed = parallel_rows.pop(match_key)
+                            matched_row = tuple(matched_row)
+                        else:
+                            row_start_time = time.time()
+                            matched_row = self.match_row(brand, product, size, color)
+                            row_elapsed = time.time() - row_start_time
+                    
+                        # 단일 행 처리가 3초를 초과하면 경고
+                        if row_elapsed > 3:
+                            print(f"⚠️  행 {current_index} 느림: {row_elapsed:.1f}초", flush=True)
+                    
+                        # 단일 행 처리가 10초를 초과하면 강제 중단 (같은 조합의 이후 행도 실패로 처리)
+                        if row_elapsed > 10:
+                            print(f"❌ 행 {current_index} 시간 초과 (10초)", flush=True)
+                            matched_row = ("매칭 실패", "", "", False)
+                        matched_rows[match_key] = matched_row
+                    공급가, 중도매, 브랜드상품명, success = matched_row
                 
-                # 단일 행 처리가 10초를 초과하면 강제 중단
-                if row_elapsed > 10:
-                    print(f"❌ 행 {current_index} 시간 초과 (10초)", flush=True)
+                except Exception as e:
+                    logger.error(f"행 {current_index} 매칭 중 오류: {e} (브랜드: {brand}, 상품: {product})")
                     공급가, 중도매, 브랜드상품명, success = "매칭 실패", "", "", False
+
+                # 결과 저장 (리스트에 - 빠름!)
+                if success and 공급가 != "매칭 실패":
+                    results['N열(중도매명)'][current_index] = 중도매
+                    results['O열(도매가격)'][current_index] = 공급가
+                    success_count += 1
+                else:
+                    # 매칭 실패한 상품 정보 수집 (필수 정보만)
+                    failed_product = {
+                        '브랜드': brand,
+                        '상품명': product,
+                        '색상': color,
+                        '사이즈': size,
+                        '수량': quantity,
+                        '행번호': idx
+                    }
                 
-            except Exception as e:
-                logger.error(f"행 {current_index} 매칭 중 오류: {e} (브랜드: {brand}, 상품: {product})")
-                공급가, 중도매, 브랜드상품명, success = "매칭 실패", "", "", False
-
-            # 결과 저장 (리스트에 - 빠름!)
-            if success and 공급가 != "매칭 실패":
-                results['N열(중도매명)'][current_index] = 중도매
-                results['O열(도매가격)'][current_index] = 공급가
-                # W열 금액 계산: 도매가격 × 수량
-                try:
-                    total_amount = float(공급가) * int(quantity)
-                    results['W열(금액)'][current_index] = total_amount
-                except:
-                    results['W열(금액)'][current_index] = 0
-                success_count += 1
-            else:
-                # 매칭 실패한 상품 정보 수집 (필수 정보만)
-                failed_product = {
-                    '브랜드': brand,
-                    '상품명': product,
-                    '색상': color,
-                    '사이즈': size,
-                    '수량': quantity,
-                    '행번호': idx
-                }
-                
-                # ⚡ 성능 개선: row.items() 제거 (매우 느림!)
-                # 원본 데이터는 나중에 sheet2_df에서 가져올 수 있음
+                    # ⚡ 성능 개선: row.items() 제거 (매우 느림!)
+                    # 원본 데이터는 나중에 sheet2_df에서 가져올 수 있음
                 
-                failed_products.append(failed_product)
+                    failed_products.append(failed_product)
                 
-                results['N열(중도매명)'][current_index] = ""
-                results['O열(도매가격)'][current_index] = 0
-                results['W열(금액)'][current_index] = 0
+                    results['N열(중도매명)'][current_index] = ""
+                    results['O열(도매가격)'][current_index] = 0
+            
+            # 묶음 단위 진행률 출력
+            elapsed_time = time.time() - start_time
+            progress = (batch_end / total_count) * 100
+            eta = elapsed_time / batch_end * (total_count - batch_end)
+            print(f"\r진행률: {batch_end:,}/{total_count:,} ({progress:.1f}%) - 경과: {elapsed_time:.1f}초, 예상: {eta:.1f}초", flush=True)
+            
+            # 타임아웃 체크 (10분으로 단축)
+            if elapsed_time > 600:  # 10분
+                logger.error("매칭 처리 타임아웃 (10분 초과) - 처리 중단")
+                break
 
         # ⚡ 성능 개선: 루프 완료 후 한 번에 할당 (매우 빠름!)
         print("\n결과 저장 중...", flush=True)
         sheet2_df['N열(중도매명)'] = results['N열(중도매명)']
         sheet2_df['O열(도매가격)'] = results['O열(도매가격)']
-        sheet2_df['W열(금액)'] = results['W열(금액)']
+        # ⚡ W열 금액 = 도매가격 × 정수 수량 - 행마다 try/except 대신 도매가격은 컬럼 전체를 한 번에 숫자 변환,
+        # 수량은 고유값마다 한 번만 int() 변환 (2.5 -> 2, 변환 실패는 0)
+        if success_count:
+            supply_prices = pd.to_numeric(pd.Series(results['O열(도매가격)'], dtype=object), errors='coerce').fillna(0)
+            order_quantities = self._map_unique(pd.Series(quantities, dtype=object), self._quantity_to_int)
+            sheet2_df['W열(금액)'] = (supply_prices * order_quantities.astype(np.int64)).to_numpy(dtype=float)
+        else:
+            sheet2_df['W열(금액)'] = 0
         
         total_elapsed = time.time() - start_time
         success_rate = (success_count / total_count * 100) if total_count > 0 else 0
@@ -1667,17 +2254,20 @@ class BrandMatchingSystem:
     def save_to_excel(self, sheet2_df: pd.DataFrame, filename: str = "브랜드매칭결과.xlsx"):
         """Sheet2 형식으로 엑셀 파일 저장"""
         try:
+            if XLSXWRITER_AVAILABLE:
+                # ⚡ 행 단위 스트리밍 저장 (워크시트 전체를 메모리에 올리지 않음)
+                self._write_excel_streaming(sheet2_df, filename, 'Sheet2', [15] * len(sheet2_df.columns),
+                                            {'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+                logger.info(f"엑셀 파일 저장 완료: {filename}")
+                return filename
+            
             with pd.ExcelWriter(filename, engine='openpyxl') as writer:
                 # Sheet2 탭에 저장
                 sheet2_df.to_excel(writer, sheet_name='Sheet2', index=False)
 
                 # 컬럼 너비 조정
                 worksheet = writer.sheets['Sheet2']
-                for i, column in enumerate(sheet2_df.columns, 1):
-                    if i <= 26:
-                        column_letter = chr(64 + i)
-                    else:
-                        column_letter = f"A{chr(64 + i - 26)}"
+                for column_letter in map(get_column_letter, range(1, len(sheet2_df.columns) + 1)):
                     worksheet.column_dimensions[column_letter].width = 15
 
             logger.info(f"엑셀 파일 저장 완료: {filename}")
@@ -1690,6 +2280,17 @@ class BrandMatchingSystem:
     def save_similarity_results_to_excel(self, similarity_df: pd.DataFrame, filename: str = "유사도매칭결과.xlsx"):
         """유사도 매칭 결과를 엑셀 파일로 저장"""
         try:
+            if XLSXWRITER_AVAILABLE:
+                # ⚡ 행 단위 스트리밍 저장 + 유사도 컬럼 조건부 서식
+                self._write_excel_streaming(
+                    similarity_df, filename, '유사도매칭결과',
+                    [self._similarity_column_width(column) for column in similarity_df.columns],
+                    {'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#366092', 'border': 1, 'align': 'center'},
+                    [col_idx for col_idx, column in enumerate(similarity_df.columns) if '유사도' in column]
+                )
+                logger.info(f"유사도 매칭 결과 저장 완료: {filename}")
+                return filename
+            
             with pd.ExcelWriter(filename, engine='openpyxl') as writer:
                 # 유사도 매칭 결과 저장
                 similarity_df.to_excel(writer, sheet_name='유사도매칭결과', index=False)
@@ -1697,21 +2298,7 @@ class BrandMatchingSystem:
                 # 컬럼 너비 조정
                 worksheet = writer.sheets['유사도매칭결과']
                 for i, column in enumerate(similarity_df.columns, 1):
-                    column_letter = self._get_column_letter(i)
-                    
-                    # 컬럼명에 따른 너비 조정
-                    if '상품명' in column:
-                        worksheet.column_dimensions[column_letter].width = 30
-                    elif '유사도' in column:
-                        worksheet.column_dimensions[column_letter].width = 12
-                    elif '브랜드' in column:
-                        worksheet.column_dimensions[column_letter].width = 15
-                    elif '색상' in column or '사이즈' in column:
-                        worksheet.column_dimensions[column_letter].width = 15
-                    elif '중도매' in column or '공급가' in column:
-                        worksheet.column_dimensions[column_letter].width = 12
-                    else:
-                        worksheet.column_dimensions[column_letter].width = 15
+                    worksheet.column_dimensions[get_column_letter(i)].width = self._similarity_column_width(column)
 
                 # 헤더 스타일 적용
                 from openpyxl.styles import Font, PatternFill, Alignment
@@ -1723,22 +2310,20 @@ class BrandMatchingSystem:
                     cell.fill = header_fill
                     cell.alignment = Alignment(horizontal="center")
 
-                # 유사도 컬럼에 조건부 서식 적용
+                # 유사도 컬럼에 조건부 서식 적용 - 셀마다 채우지 않고 컬럼당 규칙 3개만 저장 (엑셀이 평가)
+                # 유사도 값은 "0.833" 같은 문자열로 저장되므로 VALUE()로 숫자 변환 후 비교 (변환 실패 셀은 서식 없음)
+                from openpyxl.formatting.rule import FormulaRule
+                last_row = len(similarity_df) + 1
                 for col_idx, column in enumerate(similarity_df.columns, 1):
-                    if '유사도' in column:
-                        column_letter = self._get_column_letter(col_idx)
-                        for row_idx in range(2, len(similarity_df) + 2):
-                            cell = worksheet[f"{column_letter}{row_idx}"]
-                            try:
-                                value = float(cell.value)
-                                if value >= 0.8:
-                                    cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-                                elif value >= 0.6:
-                                    cell.fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-                                elif value >= 0.3:
-                                    cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-                            except:
-                                pass
+                    if '유사도' in column and last_row >= 2:
+                        column_letter = get_column_letter(col_idx)
+                        for threshold, color in self.SIMILARITY_FILL_COLORS:
+                            worksheet.conditional_formatting.add(
+                                f"{column_letter}2:{column_letter}{last_row}",
+                                FormulaRule(formula=[f"VALUE({column_letter}2)>={threshold}"],
+                                            fill=PatternFill(start_color=color, end_color=color, fill_type="solid"),
+                                            stopIfTrue=True)
+                            )
 
             logger.info(f"유사도 매칭 결과 저장 완료: {filename}")
             return filename
@@ -1747,11 +2332,46 @@ class BrandMatchingSystem:
             logger.error(f"유사도 매칭 결과 저장 실패: {e}")
             raise e
 
-    def _get_column_letter(self, col_idx: int) -> str:
-        """컬럼 인덱스를 엑셀 컬럼 문자로 변환"""
-        result = ""
-        while col_idx > 0:
-            col_idx -= 1
-            result = chr(col_idx % 26 + ord('A')) + result
-            col_idx //= 26
-        return result 
\ No newline at end of file
+    @staticmethod
+    def _similarity_column_width(column: str) -> int:
+        """유사도 결과 컬럼명에 따른 엑셀 컬럼 너비"""
+        if '상품명' in column:
+            return 30
+        elif '유사도' in column:
+            return 12
+        elif '브랜드' in column:
+            return 15
+        elif '색상' in column or '사이즈' in column:
+            return 15
+        elif '중도매' in column or '공급가' in column:
+            return 12
+        return 15
+
+    def _write_excel_streaming(self, df: pd.DataFrame, filename: str, sheet_name: str, column_widths: List[int],
+                               header_style: Dict, similarity_columns: List[int] = ()):
+        """xlsxwriter constant_memory 모드로 행 순서대로 바로 디스크에 기록
+        
+        pandas to_excel은 컬럼 순서로 셀을 쓰므로 constant_memory와 함께 쓸 수 없어 행 단위로 직접 기록
+        """
+        with xlsxwriter.Workbook(filename, {'constant_memory': True, 'strings_to_urls': False}) as workbook:
+            worksheet = workbook.add_worksheet(sheet_name)
+            for col_idx, width in enumerate(column_widths):
+                worksheet.set_column(col_idx, col_idx, width)
+            
+            worksheet.write_row(0, 0, [str(column) for column in df.columns], workbook.add_format(header_style))
+            for row_idx, values in enumerate(df.itertuples(index=False, name=None), 1):
+                # 결측값은 pandas to_excel과 동일하게 빈 셀
+                worksheet.write_row(row_idx, 0, [value if self._is_present(value) else None for value in values])
+            
+            # 유사도 컬럼 조건부 서식 (문자열로 저장된 값을 VALUE()로 변환해 비교)
+            last_row = len(df)
+            if last_row >= 1:
+                for col_idx in similarity_columns:
+                    column_letter = get_column_letter(col_idx + 1)
+                    for threshold, color in self.SIMILARITY_FILL_COLORS:
+                        worksheet.conditional_format(1, col_idx, last_row, col_idx, {
+                            'type': 'formula',
+                            'criteria': f"=VALUE({column_letter}2)>={threshold}",
+                            'format': workbook.add_format({'bg_color': f"#{color}"}),
+                            'stop_if_true': True,
+                        })
\ No newline at end of file
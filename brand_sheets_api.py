@@ -7,12 +7,20 @@
 import pandas as pd
 import requests
 import logging
+import importlib.util
 from typing import Optional
 from io import StringIO
-import gc
 
 logger = logging.getLogger(__name__)
 
+# pyarrow는 pandas가 string[pyarrow] dtype을 만들 때 직접 import하므로 여기서는 설치 여부만 확인
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+if not PYARROW_AVAILABLE:
+    logger.warning("pyarrow not available, storing brand text columns as python strings")
+
+# 텍스트 컬럼 dtype - pyarrow가 있으면 Arrow 버퍼(연속 바이트 + 오프셋)에 저장하여 셀마다 파이썬 객체를 두지 않음
+STRING_DTYPE = 'string[pyarrow]' if PYARROW_AVAILABLE else 'string'
+
 class BrandSheetsAPI:
     """브랜드매칭시트 API를 사용한 데이터 읽기 - 메모리 최적화"""
     
@@ -105,10 +113,6 @@ class BrandSheetsAPI:
                 if not processed_chunk.empty:
                     processed_chunks.append(processed_chunk)
                 
-                # 메모리 정리
-                del chunk
-                gc.collect()
-                
                 # 진행률 로깅
                 if chunk_num % 5 == 0 or chunk_num == total_chunks:
                     logger.info(f"진행률: {chunk_num}/{total_chunks} ({(chunk_num/total_chunks)*100:.1f}%)")
@@ -118,9 +122,8 @@ class BrandSheetsAPI:
                 logger.info("청크들을 결합하는 중...")
                 final_df = pd.concat(processed_chunks, ignore_index=True)
                 
-                # 메모리 정리
+                # 메모리 정리 (청크 DataFrame은 순환 참조가 없어 참조 해제만으로 바로 반환됨)
                 del processed_chunks
-                gc.collect()
                 
                 # 최종 스마트 중복 제거 및 정리
                 logger.info("최종 데이터 정리 중...")
@@ -193,11 +196,12 @@ class BrandSheetsAPI:
             
             # 필요한 컬럼들 추출 (메모리 효율적)
             brand_data = pd.DataFrame()
+            # 브랜드/중도매는 BrandMatchingSystem.load_brand_data에서 category로 바뀌므로 Arrow 변환 없이 기본 string dtype
             brand_data['브랜드'] = chunk.iloc[:, 0].fillna('').astype('string')  # string dtype 사용
-            brand_data['상품명'] = chunk.iloc[:, 1].fillna('').astype('string')
+            brand_data['상품명'] = chunk.iloc[:, 1].fillna('').astype(STRING_DTYPE)
             brand_data['중도매'] = chunk.iloc[:, 2].fillna('').astype('string')
             brand_data['공급가'] = pd.to_numeric(chunk.iloc[:, 3], errors='coerce').fillna(0).astype('float32')  # float32 사용
-            brand_data['옵션입력'] = chunk.iloc[:, 4].fillna('').astype('string')
+            brand_data['옵션입력'] = chunk.iloc[:, 4].fillna('').astype(STRING_DTYPE)
             
             # 필터링 전 데이터 상태 분석
             empty_brand = (brand_data['브랜드'].str.strip() == '').sum()
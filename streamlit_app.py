@@ -2,6 +2,7 @@ import streamlit as st
 import pandas as pd
 import os
 from datetime import datetime
+from collections import Counter
 import sys
 import os
 sys.path.append(os.path.dirname(__file__))
@@ -78,7 +79,7 @@ def get_system_stats(matching_system):
         return {
             'brand_count': brand_count,
             'keyword_count': keyword_count,
-            'cache_size': len(matching_system._normalized_cache) if hasattr(matching_system, '_normalized_cache') else 0
+            'cache_size': matching_system._normalize_cached.cache_info().currsize if hasattr(matching_system, '_normalize_cached') else 0
         }
     except:
         return {'brand_count': 0, 'keyword_count': 0, 'cache_size': 0}
@@ -264,7 +265,7 @@ def show_matching_page(matching_system, file_processor):
         # 결과 요약
         if not result_df.empty:
             exact_matched = len(result_df[pd.to_numeric(result_df['O열(도매가격)'], errors='coerce') > 0]) if 'O열(도매가격)' in result_df.columns else 0
-            similarity_matched = len(similarity_df[similarity_df['매칭_상태'] == '유사매칭']) if not similarity_df.empty and '매칭_상태' in similarity_df.columns else 0
+            similarity_matched, _ = BrandMatchingSystem.count_similarity_results(similarity_df)
             
             st.info(f"✅ **매칭 완료**: 정확 매칭 {exact_matched:,}개, 유사도 매칭 {similarity_matched:,}개")
         
@@ -355,8 +356,8 @@ def show_matching_page(matching_system, file_processor):
             st.metric("💾 메모리 사용량", f"{memory_mb:.0f} MB")
         except ImportError:
             # psutil이 없는 경우 캐시 정보만 표시
-            if hasattr(matching_system, '_normalized_cache'):
-                cache_size = len(matching_system._normalized_cache)
+            if hasattr(matching_system, '_normalize_cached'):
+                cache_size = matching_system._normalize_cached.cache_info().currsize
                 st.metric("🗄️ 캐시 항목", f"{cache_size:,}개")
         
         # 마지막 업데이트 시간 표시
@@ -465,7 +466,7 @@ def process_matching(uploaded_files, matching_system, file_processor):
             similarity_df = matching_system.find_similar_products_for_failed_matches(failed_products)
             
             similarity_elapsed = time.time() - similarity_start
-            successful_similarity = len(similarity_df[similarity_df['매칭_상태'] == '유사매칭']) if not similarity_df.empty else 0
+            successful_similarity, _ = BrandMatchingSystem.count_similarity_results(similarity_df)
             st.success(f"✅ 유사도 매칭 완료! {successful_similarity:,}개 성공 - 소요시간: {similarity_elapsed:.1f}초")
         
         # 6단계: 완료
@@ -662,9 +663,8 @@ def show_similarity_match_results(similarity_df, matching_system):
         st.markdown("### 🔍 유사도 매칭 통계")
         col1, col2, col3, col4 = st.columns(4)
         
-        # 유사도 매칭 성공 (종합_유사도 >= 0.3)
-        successful_similarity = len(similarity_df[similarity_df['매칭_상태'] == '유사매칭'])
-        failed_similarity = len(similarity_df[similarity_df['매칭_상태'] == '매칭실패'])
+        # 유사도 매칭 성공 (종합_유사도 >= 0.3, 전체검색 유사매칭 포함)
+        successful_similarity, failed_similarity = BrandMatchingSystem.count_similarity_results(similarity_df)
         
         with col1:
             st.metric("🔍 유사도 매칭 대상", f"{len(similarity_df):,}개")
@@ -743,9 +743,8 @@ def show_similarity_match_results_simple(similarity_df, matching_system):
         st.markdown("### 🔍 유사도 매칭 통계")
         col1, col2, col3, col4 = st.columns(4)
         
-        # 유사도 매칭 성공 (종합_유사도 >= 0.3)
-        successful_similarity = len(similarity_df[similarity_df['매칭_상태'] == '유사매칭'])
-        failed_similarity = len(similarity_df[similarity_df['매칭_상태'] == '매칭실패'])
+        # 유사도 매칭 성공 (종합_유사도 >= 0.3, 전체검색 유사매칭 포함)
+        successful_similarity, failed_similarity = BrandMatchingSystem.count_similarity_results(similarity_df)
         
         with col1:
             st.metric("🔍 유사도 매칭 대상", f"{len(similarity_df):,}개")
@@ -828,8 +827,7 @@ def show_combined_statistics(result_df, similarity_df):
         
         # 유사도 매칭 통계 계산
         if not similarity_df.empty:
-            similarity_matched = len(similarity_df[similarity_df['매칭_상태'] == '유사매칭'])
-            similarity_failed = len(similarity_df[similarity_df['매칭_상태'] == '매칭실패'])
+            similarity_matched, similarity_failed = BrandMatchingSystem.count_similarity_results(similarity_df)
         else:
             similarity_matched = 0
             similarity_failed = 0
@@ -1103,10 +1101,12 @@ def show_info_page(matching_system):
             
             # 브랜드별 통계
             if len(matching_system.brand_data) > 0:
-                brands = {}
-                for _, item in matching_system.brand_data.iterrows():
-                    brand = item.get('브랜드', 'Unknown')
-                    brands[brand] = brands.get(brand, 0) + 1
+                # 브랜드 컬럼을 한 번에 집계 (iterrows로 행마다 Series 생성 제거)
+                brand_column = matching_system.brand_data.get('브랜드')
+                if brand_column is not None:
+                    brands = Counter(brand_column.tolist())
+                else:
+                    brands = {'Unknown': len(matching_system.brand_data)}
                 
                 st.subheader("🏷️ 브랜드별 상품 수")
                 brand_df = pd.DataFrame(list(brands.items()), columns=['브랜드', '상품수'])
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JIT 커널 테스트 (numba 컴파일 결과가 파이썬 원본 함수와 같은지 확인)
+"""
+
+import numpy as np
+
+import brand_matching_jit
+
+
+def test_kernels_are_compiled():
+    # requirements.txt에 numba가 있으므로 배포 환경에서는 컴파일된 커널이 쓰여야 함
+    assert brand_matching_jit.NUMBA_AVAILABLE, "numba가 설치되지 않아 JIT 커널이 파이썬으로 실행됨"
+    assert brand_matching_jit.best_weighted_candidate is not brand_matching_jit._best_weighted_candidate
+    assert brand_matching_jit.apply_numeric_size_tiers is not brand_matching_jit._apply_numeric_size_tiers
+
+
+def test_best_weighted_candidate_matches_python():
+    rng = np.random.default_rng(5)
+    for _ in range(200):
+        n = int(rng.integers(0, 8))
+        product_sim = rng.uniform(40, 100, n)
+        size_sim = rng.choice([0.0, 30.0, 60.0, 80.0, 100.0], n)
+        color_sim = rng.choice([0.0, 50.0, 100.0], n)
+        check_size = bool(rng.integers(0, 2))
+        expected = brand_matching_jit._best_weighted_candidate(product_sim, size_sim, color_sim, check_size)
+        assert brand_matching_jit.best_weighted_candidate(product_sim, size_sim, color_sim, check_size) == expected
+
+
+def test_apply_numeric_size_tiers_matches_python():
+    rng = np.random.default_rng(8)
+    for _ in range(200):
+        # -1은 숫자가 아닌 사이즈 (BrandMatchingSystem._size_variant_numbers와 같은 표현)
+        numbers1 = rng.choice([-1, 5, 7, 90, 95, 100, 110, 130], int(rng.integers(0, 5))).astype(np.int64)
+        numbers2 = rng.choice([-1, 5, 7, 90, 95, 100, 110, 130], int(rng.integers(0, 5))).astype(np.int64)
+        matrix = rng.uniform(0, 1, (numbers1.shape[0], numbers2.shape[0]))
+        expected = matrix.copy()
+        brand_matching_jit._apply_numeric_size_tiers(numbers1, numbers2, expected)
+        brand_matching_jit.apply_numeric_size_tiers(numbers1, numbers2, matrix)
+        np.testing.assert_array_equal(matrix, expected)
+
+
+if __name__ == "__main__":
+    for test in (test_kernels_are_compiled, test_best_weighted_candidate_matches_python,
+                 test_apply_numeric_size_tiers_matches_python):
+        test()
+        print(f"✅ {test.__name__}")
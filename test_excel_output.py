@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+엑셀 저장 테스트 (xlsxwriter 스트리밍 경로와 openpyxl 대체 경로를 모두 저장 후 openpyxl로 다시 읽어 비교)
+"""
+
+import os
+import tempfile
+from unittest import mock
+
+import numpy as np
+import openpyxl
+import pandas as pd
+
+import brand_matching_system
+from brand_matching_system import BrandMatchingSystem
+from test_similarity_regression import make_catalog, make_system
+
+SIMILARITY_DF = pd.DataFrame({
+    '원본_브랜드': ['소예', '', None, '린도'],
+    '원본_상품명': ['클래식무발타이즈', '티셔츠', '바지', '원피스'],
+    '유사상품_공급가': [12000.0, np.nan, 3, 8000.0],
+    '상품명_유사도': ['0.700', '0.650', 'abc', '1.000'],
+    '종합_유사도': ['0.850', '0.400', '0.100', '0.620'],
+    '매칭_상태': ['유사매칭', '유사매칭', '매칭실패', BrandMatchingSystem.CATALOG_SIMILAR_STATUS],
+})
+
+# 두 경로 모두 결측값/빈 문자열은 빈 셀, 숫자는 숫자 셀
+EXPECTED_ROWS = [
+    ('소예', '클래식무발타이즈', 12000, '0.700', '0.850', '유사매칭'),
+    (None, '티셔츠', None, '0.650', '0.400', '유사매칭'),
+    (None, '바지', 3, 'abc', '0.100', '매칭실패'),
+    ('린도', '원피스', 8000, '1.000', '0.620', BrandMatchingSystem.CATALOG_SIMILAR_STATUS),
+]
+
+
+def save_both_ways(save, df: pd.DataFrame) -> dict:
+    """xlsxwriter 사용/미사용으로 각각 저장한 파일을 openpyxl 워크시트로 반환"""
+    sheets = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for use_xlsxwriter in (True, False):
+            filename = os.path.join(directory, f'out_{use_xlsxwriter}.xlsx')
+            with mock.patch.object(brand_matching_system, 'XLSXWRITER_AVAILABLE', use_xlsxwriter):
+                save(df, filename)
+            sheets[use_xlsxwriter] = openpyxl.load_workbook(filename).active
+    return sheets
+
+
+def fill_rules(worksheet) -> list:
+    """조건부 서식 규칙 (범위, 수식, stopIfTrue, 채우기 색)"""
+    return sorted(
+        (str(cf_range.sqref), tuple(rule.formula), rule.stopIfTrue, rule.dxf.fill.bgColor.rgb[-6:])
+        for cf_range, rules in worksheet.conditional_formatting._cf_rules.items()
+        for rule in rules
+    )
+
+
+def test_similarity_excel_values_and_fill_rules():
+    system = make_system(make_catalog())
+    sheets = save_both_ways(system.save_similarity_results_to_excel, SIMILARITY_DF)
+
+    expected_rules = sorted(
+        (f'{column}2:{column}5', (f'VALUE({column}2)>={threshold}',), True, color)
+        for column in ('D', 'E')  # 상품명_유사도, 종합_유사도
+        for threshold, color in BrandMatchingSystem.SIMILARITY_FILL_COLORS
+    )
+    for use_xlsxwriter, worksheet in sheets.items():
+        rows = list(worksheet.values)
+        assert worksheet.title == '유사도매칭결과', use_xlsxwriter
+        assert rows[0] == tuple(SIMILARITY_DF.columns), use_xlsxwriter
+        assert rows[1:] == EXPECTED_ROWS, use_xlsxwriter
+        assert fill_rules(worksheet) == expected_rules, use_xlsxwriter
+        assert worksheet['A1'].font.bold, use_xlsxwriter
+
+
+def test_sheet2_excel_values_in_row_order():
+    system = make_system(make_catalog())
+    # constant_memory 모드는 행 순서대로만 기록되므로 여러 행/타입이 섞인 Sheet2로 순서 확인
+    sheet2_df = pd.DataFrame({
+        'H열(브랜드)': [f'브랜드{i}' for i in range(50)],
+        'L열(수량)': list(range(50)),
+        'N열(중도매명)': ['' if i % 3 else f'도매{i}' for i in range(50)],
+        'O열(도매가격)': [float(i * 1000) for i in range(50)],
+    })
+    sheets = save_both_ways(system.save_to_excel, sheet2_df)
+
+    expected = [tuple(None if value == '' else value for value in row)
+                for row in sheet2_df.itertuples(index=False, name=None)]
+    for use_xlsxwriter, worksheet in sheets.items():
+        rows = list(worksheet.values)
+        assert worksheet.title == 'Sheet2', use_xlsxwriter
+        assert rows[0] == tuple(sheet2_df.columns), use_xlsxwriter
+        assert rows[1:] == expected, use_xlsxwriter
+        assert not fill_rules(worksheet), use_xlsxwriter
+
+
+if __name__ == "__main__":
+    for test in (test_similarity_excel_values_and_fill_rules, test_sheet2_excel_values_in_row_order):
+        test()
+        print(f"✅ {test.__name__}")
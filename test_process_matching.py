@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+process_matching 회귀 테스트 (중복 주문 조합 재사용, 순차/병렬 결과 동일성)
+"""
+
+import random
+from unittest import mock
+
+import pandas as pd
+
+import brand_matching_system
+from brand_matching_system import BrandMatchingSystem
+from test_similarity_regression import COLORS, SIZES, make_catalog, make_system
+
+
+def make_sheet2(system, catalog: pd.DataFrame, rows: int = 120, seed: int = 17) -> pd.DataFrame:
+    """카탈로그 상품(일부는 없는 상품)으로 만든 주문 Sheet1을 Sheet2로 변환 - 같은 주문 조합이 여러 번 반복됨"""
+    rng = random.Random(seed)
+    orders = []
+    for product in catalog.sample(15, random_state=seed).to_dict('records'):
+        orders.append((f"{product['브랜드']} {product['상품명']}", f"{rng.choice(COLORS)}/{rng.choice(SIZES)}"))
+    orders += [('소예 없는상품이름', '블랙/M'), ('없는브랜드 티셔츠', '핑크/S')]
+
+    sheet1_rows = []
+    for i in range(rows):
+        product, option = rng.choice(orders)
+        sheet1_rows.append(['2024-01-01', f'ORDER{i:03d}', '주문자', '위탁자', product, option,
+                            rng.choice([1, 2, 3, '2', 'x'])])
+    sheet1_df = pd.DataFrame(sheet1_rows, columns=['주문일', '주문번호', '주문자', '위탁자', '상품', '옵션', '수량'])
+    return system.convert_sheet1_to_sheet2(sheet1_df)
+
+
+def test_duplicate_orders_share_one_match():
+    catalog = make_catalog()
+    system = make_system(catalog)
+    sheet2_df = make_sheet2(system, catalog)
+
+    calls = []
+    match_row = system.match_row
+
+    def counting_match_row(brand, product, size, color):
+        calls.append((brand, product, size, color))
+        return match_row(brand, product, size, color)
+
+    with mock.patch.object(system, 'match_row', side_effect=counting_match_row):
+        result_df, failed_products = system.process_matching(sheet2_df.copy())
+
+    keys = list(zip(result_df['H열(브랜드)'], result_df['I열(상품명)'], result_df['K열(사이즈)'], result_df['J열(색상)']))
+    assert len(calls) == len(set(calls)) == len(set(keys)), "같은 주문 조합을 여러 번 매칭함"
+
+    # 같은 조합의 행은 같은 매칭 결과, 금액은 행별 수량으로 계산
+    by_key = {}
+    for key, wholesale, price in zip(keys, result_df['N열(중도매명)'], result_df['O열(도매가격)']):
+        assert by_key.setdefault(key, (wholesale, price)) == (wholesale, price), key
+    assert result_df['O열(도매가격)'].astype(float).gt(0).any()
+    quantities = result_df['L열(수량)'].map(BrandMatchingSystem._quantity_to_int)
+    pd.testing.assert_series_equal(result_df['W열(금액)'], (result_df['O열(도매가격)'].astype(float) * quantities),
+                                   check_names=False)
+
+    # 매칭 실패 목록에는 중복 조합의 행도 빠짐없이 들어감
+    failed_rows = {product['행번호'] for product in failed_products}
+    assert failed_rows == set(result_df.index[result_df['O열(도매가격)'].astype(float) == 0])
+
+
+def test_parallel_prepass_matches_serial():
+    catalog = make_catalog()
+    system = make_system(catalog)
+    sheet2_df = make_sheet2(system, catalog)
+
+    serial_df, serial_failed = system.process_matching(sheet2_df.copy())
+
+    # 병렬 사전 매칭 경로를 타도록 행 수 기준을 낮추고 CPU 수를 2로 간주
+    # (_match_rows_parallel은 클래스에서 감쌈 - 인스턴스 속성의 mock은 워커로 보낼 때 pickle되지 않음)
+    prepass = []
+    match_rows_parallel = BrandMatchingSystem._match_rows_parallel
+
+    def recording_match_rows_parallel(self, rows, deadline):
+        matched = match_rows_parallel(self, rows, deadline)
+        prepass.append((len(rows), len(matched)))
+        return matched
+
+    with mock.patch.object(BrandMatchingSystem, 'PARALLEL_MATCH_MIN_ROWS', 1), \
+            mock.patch.object(brand_matching_system.os, 'cpu_count', return_value=2), \
+            mock.patch.object(BrandMatchingSystem, '_match_rows_parallel', recording_match_rows_parallel):
+        parallel_df, parallel_failed = system.process_matching(sheet2_df.copy())
+
+    # 워커 프로세스가 모든 고유 조합을 매칭했어야 함 (예외로 순차 처리로 넘어가지 않음)
+    assert len(prepass) == 1 and prepass[0][0] == prepass[0][1] > 0, prepass
+    pd.testing.assert_frame_equal(serial_df, parallel_df)
+    assert serial_failed == parallel_failed
+
+
+if __name__ == "__main__":
+    for test in (test_duplicate_orders_share_one_match, test_parallel_prepass_matches_serial):
+        test()
+        print(f"✅ {test.__name__}")
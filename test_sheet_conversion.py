@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sheet1 -> Sheet2 변환 회귀 테스트 (기존 행 단위 변환 결과와 비교)
+"""
+
+import io
+
+import numpy as np
+import openpyxl
+import pandas as pd
+
+from test_similarity_regression import make_catalog, make_system
+
+# 빈 칸/NaN/숫자/앞뒤 공백이 섞인 업로드 Sheet1 (A~L열)
+SHEET1 = pd.DataFrame({
+    '주문일': ['2024-01-01', np.nan, '2024-01-03', 20240104, '', '2024-01-06', '2024-01-07', '2024-01-08'],
+    '주문번호': ['A1', 'A2', np.nan, 'A4', 5, 'A6', 'A7', 'A8'],
+    '주문자': ['홍길동', np.nan, '김철수', '', '이영희', '박', '최', '정'],
+    '위탁자': ['위탁1', '위탁2', np.nan, '', '위탁5', '위탁6', '위탁7', '위탁8'],
+    '상품': ['소예 클래식무발타이즈(S~XL)', '클라레오(기린) 베이직티 세트', '린도', np.nan, '  마마미  톡톡티  ',
+           ' 앞공백상품', '', '로다제이 [NEW]'],
+    '옵션': ['색상=블랙, 사이즈=M', '그레이/S', np.nan, '', '블랙 / 110', '사이즈: FREE', '핑크', '아이보리/XL'],
+    '수량': [1, 2.0, '3', np.nan, '2.5', 'x', 0, 5],
+    '옵션가': [0, 1000, np.nan, '', '500', np.nan, 0, 100],
+    '이름': ['받는이', np.nan, '수령', '', '홍', 'a', 'b', 'c'],
+    '전화': ['010-1234-5678', np.nan, '01099998888', 1012345678, '', 'x', 'y', 'z'],
+    '주소': ['서울시 강남구 역삼동 123', np.nan, '부산 해운대구 우동', '', '경기도 성남시', '제주', '서울 마포구 합정동 1', 'a b c d'],
+    '메세지': ['문앞', np.nan, '', '경비실', 'x', 'y', 'z', 'w'],
+})
+
+# 기존 행 단위 변환(iterrows) 결과 - 빈 문자열이 아닌 칸만 기록 (O열/W열은 0)
+EXPECTED_FULL = [
+    {'C열(주문일)': '2024-01-01', 'D열(아이디주문번호)': 'A1', 'F열(주문자명)': '홍길동', 'G열(위탁자명)': '위탁1(역삼동)',
+     'H열(브랜드)': '소예', 'I열(상품명)': '클래식무발타이즈', 'J열(색상)': '블랙', 'K열(사이즈)': 'M', 'L열(수량)': 1,
+     'M열(옵션가)': '0', 'R열(이름)': '받는이(역삼동)', 'S열(전화번호)': '010-1234-5678', 'T열(주소)': '서울시 강남구 역삼동 123',
+     'V열(배송메세지)': '문앞'},
+    {'D열(아이디주문번호)': 'A2', 'G열(위탁자명)': '위탁2', 'H열(브랜드)': '클라레오(기린)', 'I열(상품명)': '베이직티',
+     'J열(색상)': '그레이', 'K열(사이즈)': 'S', 'L열(수량)': 2, 'M열(옵션가)': '1000'},
+    {'C열(주문일)': '2024-01-03', 'F열(주문자명)': '김철수', 'H열(브랜드)': '린도', 'L열(수량)': 3, 'R열(이름)': '수령(우동)',
+     'S열(전화번호)': '01099998888', 'T열(주소)': '부산 해운대구 우동'},
+    {'C열(주문일)': '20240104', 'D열(아이디주문번호)': 'A4', 'L열(수량)': 1, 'S열(전화번호)': '1012345678',
+     'V열(배송메세지)': '경비실'},
+    {'D열(아이디주문번호)': '5', 'F열(주문자명)': '이영희', 'G열(위탁자명)': '위탁5', 'H열(브랜드)': '마마미',
+     'I열(상품명)': '톡톡티', 'J열(색상)': '블랙', 'K열(사이즈)': '110', 'L열(수량)': 1, 'M열(옵션가)': '500',
+     'R열(이름)': '홍', 'T열(주소)': '경기도 성남시', 'V열(배송메세지)': 'x'},
+    {'C열(주문일)': '2024-01-06', 'D열(아이디주문번호)': 'A6', 'F열(주문자명)': '박', 'G열(위탁자명)': '위탁6',
+     'H열(브랜드)': '앞공백상품', 'K열(사이즈)': 'FREE', 'L열(수량)': 1, 'R열(이름)': 'a', 'S열(전화번호)': 'x',
+     'T열(주소)': '제주', 'V열(배송메세지)': 'y'},
+    {'C열(주문일)': '2024-01-07', 'D열(아이디주문번호)': 'A7', 'F열(주문자명)': '최', 'G열(위탁자명)': '위탁7(합정동)',
+     'L열(수량)': 0, 'M열(옵션가)': '0', 'R열(이름)': 'b(합정동)', 'S열(전화번호)': 'y', 'T열(주소)': '서울 마포구 합정동 1',
+     'V열(배송메세지)': 'z'},
+    {'C열(주문일)': '2024-01-08', 'D열(아이디주문번호)': 'A8', 'F열(주문자명)': '정', 'G열(위탁자명)': '위탁8(c)',
+     'H열(브랜드)': '로다제이', 'I열(상품명)': '[new]', 'J열(색상)': '아이보리', 'K열(사이즈)': 'XL', 'L열(수량)': 5,
+     'M열(옵션가)': '100', 'R열(이름)': 'c(c)', 'S열(전화번호)': 'z', 'T열(주소)': 'a b c d', 'V열(배송메세지)': 'w'},
+]
+
+# 업로드 A~F열만 있는 경우 (수량/주소 등 없는 컬럼은 빈 값, 위탁자명에 주소 단어도 붙지 않음)
+EXPECTED_SIX = [
+    {'C열(주문일)': '2024-01-01', 'D열(아이디주문번호)': 'A1', 'F열(주문자명)': '홍길동', 'G열(위탁자명)': '위탁1',
+     'H열(브랜드)': '소예', 'I열(상품명)': '클래식무발타이즈', 'J열(색상)': '블랙', 'K열(사이즈)': 'M'},
+    {'D열(아이디주문번호)': 'A2', 'G열(위탁자명)': '위탁2', 'H열(브랜드)': '클라레오(기린)', 'I열(상품명)': '베이직티',
+     'J열(색상)': '그레이', 'K열(사이즈)': 'S'},
+    {'C열(주문일)': '2024-01-03', 'F열(주문자명)': '김철수', 'H열(브랜드)': '린도'},
+    {'C열(주문일)': '20240104', 'D열(아이디주문번호)': 'A4'},
+    {'D열(아이디주문번호)': '5', 'F열(주문자명)': '이영희', 'G열(위탁자명)': '위탁5', 'H열(브랜드)': '마마미',
+     'I열(상품명)': '톡톡티', 'J열(색상)': '블랙', 'K열(사이즈)': '110'},
+    {'C열(주문일)': '2024-01-06', 'D열(아이디주문번호)': 'A6', 'F열(주문자명)': '박', 'G열(위탁자명)': '위탁6',
+     'H열(브랜드)': '앞공백상품', 'K열(사이즈)': 'FREE'},
+    {'C열(주문일)': '2024-01-07', 'D열(아이디주문번호)': 'A7', 'F열(주문자명)': '최', 'G열(위탁자명)': '위탁7'},
+    {'C열(주문일)': '2024-01-08', 'D열(아이디주문번호)': 'A8', 'F열(주문자명)': '정', 'G열(위탁자명)': '위탁8',
+     'H열(브랜드)': '로다제이', 'I열(상품명)': '[new]', 'J열(색상)': '아이보리', 'K열(사이즈)': 'XL'},
+]
+
+EXPECTED_ONE = [{'C열(주문일)': date} for date in
+                ['2024-01-01', '', '2024-01-03', '20240104', '', '2024-01-06', '2024-01-07', '2024-01-08']]
+
+
+def expected_rows(filled: list, columns: list) -> list:
+    """빈 칸 기본값('' / O열·W열 0)에 기록된 칸을 덮어쓴 전체 행"""
+    defaults = {column: '' for column in columns}
+    defaults.update({'O열(도매가격)': 0, 'W열(금액)': 0})
+    return [{**defaults, **row} for row in filled]
+
+
+def test_convert_matches_row_by_row_output():
+    system = make_system(make_catalog())
+    for column_count, expected in ((12, EXPECTED_FULL), (6, EXPECTED_SIX), (1, EXPECTED_ONE)):
+        sheet2_df = system.convert_sheet1_to_sheet2(SHEET1.iloc[:, :column_count].copy())
+        assert sheet2_df.to_dict('records') == expected_rows(expected, list(sheet2_df.columns)), column_count
+
+
+def test_convert_empty_upload():
+    system = make_system(make_catalog())
+    sheet2_df = system.convert_sheet1_to_sheet2(pd.DataFrame())
+    assert sheet2_df.empty and len(sheet2_df.columns) == 23
+
+
+def test_convert_keeps_plain_text_dtypes():
+    system = make_system(make_catalog())
+    sheet2_df = system.convert_sheet1_to_sheet2(SHEET1.copy())
+
+    # 기존 행 단위 변환과 같은 dtype - 파이썬 문자열 리스트로 만든 DataFrame 컬럼의 기본 추론 결과
+    plain_text_dtype = pd.DataFrame({'text': ['', 'a']})['text'].dtype
+    for column in sheet2_df.columns:
+        if column in ('L열(수량)', 'O열(도매가격)', 'W열(금액)'):
+            continue
+        assert sheet2_df[column].dtype == plain_text_dtype, column
+        # 빈 칸은 NA가 아니라 빈 문자열 - 앱의 == '' 비교가 그대로 동작
+        assert not sheet2_df[column].isna().any(), column
+    assert (sheet2_df['I열(상품명)'] == '').tolist() == [False, False, True, True, False, True, True, False]
+    assert sheet2_df['L열(수량)'].tolist() == [1, 2, 3, 1, 1, 1, 0, 5]
+
+
+def test_sheet2_text_columns_accept_new_values():
+    system = make_system(make_catalog())
+    sheet2_df = system.convert_sheet1_to_sheet2(SHEET1.copy())
+
+    # 앱에서 사용자가 수정하는 값처럼 기존에 없던 값 대입/빈 값 채우기가 그대로 되어야 함
+    for column in ('H열(브랜드)', 'J열(색상)', 'K열(사이즈)'):
+        assert not isinstance(sheet2_df[column].dtype, pd.CategoricalDtype), column
+        sheet2_df.loc[0, column] = f'{column} 수정값'
+        sheet2_df[column] = sheet2_df[column].fillna('')
+    assert sheet2_df.loc[0, 'J열(색상)'] == 'J열(색상) 수정값'
+
+    # 엑셀 내보내기 후 다시 읽어도 같은 값
+    output = io.BytesIO()
+    sheet2_df.to_excel(output, index=False, engine='openpyxl')
+    output.seek(0)
+    sheet = openpyxl.load_workbook(output).active
+    header = [cell.value for cell in sheet[1]]
+    for column in ('H열(브랜드)', 'J열(색상)', 'K열(사이즈)'):
+        position = header.index(column)
+        exported = [row[position] or '' for row in sheet.iter_rows(min_row=2, values_only=True)]
+        assert exported == sheet2_df[column].tolist(), column
+
+
+if __name__ == "__main__":
+    for test in (test_convert_matches_row_by_row_output, test_convert_empty_upload,
+                 test_convert_keeps_plain_text_dtypes, test_sheet2_text_columns_accept_new_values):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+유사도 매칭 회귀 테스트 (구글 시트 없이 합성 브랜드 데이터로 실행)
+"""
+
+import random
+import re
+from unittest import mock
+
+import pandas as pd
+
+import brand_matching_system
+from brand_matching_system import BrandMatchingSystem
+
+BRANDS = ['소예', '린도', '마마미', '로다제이', '보니토', '니니벨로']
+WORDS = ['티셔츠', '바지', '원피스', '가디건', '후드', '맨투맨', '점퍼', '니트', '레깅스', '래쉬가드',
+         '베어', '발레', '썸머', '클래식', '세일러', '린넨', '바디수트', '헤어밴드', '코코넛', '셋업']
+SUFFIX = ['', '(S~XL)', '(13~15)', ' 세트', '[NEW]', ' KC']
+COLORS = ['블랙', '화이트', '네이비', '베이지', '그레이', '핑크', '아이보리']
+SIZES = ['S', 'M', 'L', 'XL', 'JS', 'JM', 'FREE', '5', '7', '9', '90', '100', '110']
+
+
+def make_catalog(seed: int = 7) -> pd.DataFrame:
+    """브랜드별 20~70개 상품의 합성 카탈로그"""
+    rng = random.Random(seed)
+    rows = []
+    for brand in BRANDS:
+        for _ in range(rng.randint(20, 70)):
+            name = ''.join(rng.sample(WORDS, rng.randint(1, 3))) + rng.choice(SUFFIX)
+            colors = '|'.join(rng.sample(COLORS, rng.randint(1, 3)))
+            sizes = '|'.join(rng.sample(SIZES, rng.randint(1, 4)))
+            rows.append((brand, name, f'{brand}도매', float(rng.randint(5, 40) * 1000),
+                         f'색상{{{colors}}}//사이즈{{{sizes}}}'))
+    catalog = pd.DataFrame(rows, columns=['브랜드', '상품명', '중도매', '공급가', '옵션입력'])
+    catalog['공급가'] = catalog['공급가'].astype('float32')
+    return catalog.drop_duplicates(subset=['브랜드', '상품명']).reset_index(drop=True)
+
+
+def make_system(catalog: pd.DataFrame) -> BrandMatchingSystem:
+    """합성 카탈로그를 읽는 매칭 시스템"""
+    with mock.patch.object(brand_matching_system.brand_sheets_api, 'read_brand_matching_data',
+                           side_effect=lambda: catalog.copy()):
+        return BrandMatchingSystem()
+
+
+def failed_product(brand: str, product_name: str, row: int) -> dict:
+    return {'브랜드': brand, '상품명': product_name, '색상': '블랙', '사이즈': 'M', '행번호': row}
+
+
+def test_brandless_inputs_are_marked():
+    catalog = make_catalog()
+    system = make_system(catalog)
+    known = max(catalog['상품명'], key=len)
+
+    failed = [
+        failed_product('', known, 0),                     # 브랜드 없음
+        failed_product('없는브랜드', known + ' 신상', 1),   # 인덱스에 없는 브랜드
+        failed_product('', 'zzzqqqxxx', 2),               # 전체 카탈로그에도 비슷한 상품 없음
+    ]
+    result_df = system.find_similar_products_for_failed_matches(failed)
+
+    assert '유사매칭' not in set(result_df['매칭_상태']), "브랜드 없는 입력이 브랜드 내 유사매칭으로 표시됨"
+    statuses = dict(zip(result_df['원본_상품명'], result_df['매칭_상태']))
+    assert statuses.get(known) == BrandMatchingSystem.CATALOG_SIMILAR_STATUS
+    assert statuses.get(known + ' 신상') == BrandMatchingSystem.CATALOG_SIMILAR_STATUS
+    assert 'zzzqqqxxx' not in statuses, "후보가 없는 입력은 결과에서 제외되어야 함"
+
+
+def test_known_brand_rows_unchanged():
+    catalog = make_catalog()
+    system = make_system(catalog)
+    rng = random.Random(11)
+
+    known = [failed_product(row['브랜드'], row['상품명'] + rng.choice(['', ' 신상', '_변형']), i)
+             for i, row in enumerate(catalog.sample(40, random_state=3).to_dict('records'))]
+    brandless = [failed_product('', name, 100 + i)
+                 for i, name in enumerate(catalog['상품명'].sample(10, random_state=5))]
+
+    alone = system.find_similar_products_for_failed_matches(known)
+    mixed = system.find_similar_products_for_failed_matches(known + brandless)
+    mixed = mixed[mixed['매칭_상태'] != BrandMatchingSystem.CATALOG_SIMILAR_STATUS]
+
+    key = ['원본_행번호', '유사상품_상품명', '종합_유사도', '매칭_상태']
+    pd.testing.assert_frame_equal(alone[key].sort_values('원본_행번호').reset_index(drop=True),
+                                  mixed[key].sort_values('원본_행번호').reset_index(drop=True))
+    assert set(alone['매칭_상태']) <= {'유사매칭', '매칭실패'}
+
+
+def test_similarity_counts_cover_all_rows():
+    catalog = make_catalog()
+    system = make_system(catalog)
+
+    failed = [failed_product(row['브랜드'], row['상품명'] + ' 신상', i)
+              for i, row in enumerate(catalog.sample(20, random_state=9).to_dict('records'))]
+    failed += [failed_product('', max(catalog['상품명'], key=len), 50),  # 전체검색 유사매칭
+               failed_product('소예', 'zzzqqqxxx', 51)]                   # 브랜드 후보는 있지만 매칭실패
+    result_df = system.find_similar_products_for_failed_matches(failed)
+    assert {'유사매칭', '매칭실패', BrandMatchingSystem.CATALOG_SIMILAR_STATUS} <= set(result_df['매칭_상태'])
+
+    # 화면(streamlit_app)과 로컬 앱 통계가 쓰는 집계 - 성공 + 실패가 유사도 결과 전체와 같아야 함
+    matched, failed_count = BrandMatchingSystem.count_similarity_results(result_df)
+    assert matched + failed_count == len(result_df)
+    assert matched == result_df['매칭_상태'].isin(['유사매칭', BrandMatchingSystem.CATALOG_SIMILAR_STATUS]).sum()
+    assert BrandMatchingSystem.count_similarity_results(pd.DataFrame()) == (0, 0)
+
+
+def test_normalize_mixed_brackets():
+    system = make_system(make_catalog())
+
+    def sequential(name: str) -> str:
+        # 괄호 3회 → 대괄호 → 중괄호 → 특수문자 순서의 기존 정규화 (키워드 제거 전 단계)
+        for _ in range(3):
+            name = re.sub(r'\([^()]*\)', '', name)
+        name = re.sub(r'\[[^\]]*\]', '', name)
+        name = re.sub(r'\{[^}]*\}', '', name)
+        name = re.sub(r'[^\w\s가-힣]', ' ', name)
+        return re.sub(r'\s+', ' ', name).strip()
+
+    # 엇갈린 괄호는 제거 순서에 따라 결과가 달라짐 (예: '{ab[cd}ef]' → 'ab')
+    for suffix in ['{ab[cd}ef]', '[ab{cd]ef}', '(ab[cd)ef]', '[ab(cd]ef)', '{xy(zw}uv)', '((((ab))))cd', '[S~XL] {세트}']:
+        name = '티셔츠 ' + suffix
+        assert system._normalize_impl(name) == sequential(name), name
+
+
+def reference_best_match(system: BrandMatchingSystem, brand: str, product_name: str, color: str, size: str):
+    """기존 순차 유사도 매칭 루프 (브랜드 카탈로그 순서 앞쪽 30개, 최고 점수 중 첫 후보) - 비교 기준"""
+    normalized_product_name = system.normalize_product_name(product_name)
+    best_match, best_score = None, 0.0
+    for idx in system.brand_index.get(brand.lower(), [])[:30]:
+        row = system.brand_data.iloc[idx]
+        brand_product = str(row.get('상품명', '')).strip()
+        brand_options = str(row.get('옵션입력', '')).strip()
+        product_similarity = system.calculate_string_similarity(
+            normalized_product_name, system.normalize_product_name(brand_product))
+        if product_similarity < 0.3:
+            continue
+
+        color_similarity = size_similarity = 0.0
+        brand_color = system.extract_color(brand_options)
+        brand_size = system.extract_size(brand_options)
+        if color and brand_color:
+            color_similarity = max((system.calculate_color_similarity(c1, c2)
+                                    for c1 in system.parse_color_variants(color)
+                                    for c2 in system.parse_color_variants(brand_color)), default=0.0)
+        if size and brand_size:
+            size_similarity = max((system.calculate_size_similarity(s1, s2)
+                                   for s1 in system.parse_size_variants(size)
+                                   for s2 in system.parse_size_variants(brand_size)), default=0.0)
+
+        total_score = product_similarity * 0.6 + color_similarity * 0.2 + size_similarity * 0.2
+        if not color and not size:
+            total_score = product_similarity
+        elif not color:
+            total_score = product_similarity * 0.8 + size_similarity * 0.2
+        elif not size:
+            total_score = product_similarity * 0.8 + color_similarity * 0.2
+
+        if total_score > best_score:
+            best_score = total_score
+            best_match = (brand_product, f"{product_similarity:.3f}", f"{color_similarity:.3f}",
+                          f"{size_similarity:.3f}", f"{total_score:.3f}")
+    return best_match
+
+
+def test_failed_search_matches_reference():
+    catalog = make_catalog()
+    system = make_system(catalog)
+    rng = random.Random(23)
+
+    failed = []
+    for i, row in enumerate(catalog.sample(200, random_state=13).to_dict('records')):
+        name = row['상품명']
+        roll = rng.random()
+        if roll < 0.3:
+            name = ''.join(rng.sample(WORDS, 2))
+        elif roll < 0.6:
+            name = name + rng.choice(['(S~XL)', ' 신상', '(13~15)', '★'])
+        color = rng.choice(COLORS + ['', '블랙/화이트'])
+        size = rng.choice(SIZES + ['', 'S(3~4)'])
+        failed.append({'브랜드': row['브랜드'], '상품명': name, '색상': color, '사이즈': size, '행번호': i})
+
+    result_df = system.find_similar_products_for_failed_matches(failed)
+    results = {row['원본_행번호']: row for row in result_df.to_dict('records')}
+
+    columns = ['유사상품_상품명', '상품명_유사도', '색상_유사도', '사이즈_유사도', '종합_유사도']
+    mismatches = []
+    for product in failed:
+        expected = reference_best_match(system, product['브랜드'], product['상품명'], product['색상'], product['사이즈'])
+        row = results[product['행번호']]
+        actual = tuple(row[column] for column in columns) if row['유사상품_상품명'] else None
+        if actual != expected:
+            mismatches.append((product, expected, actual))
+    assert not mismatches, f"{len(mismatches)}개 불일치: {mismatches[:3]}"
+
+
+if __name__ == "__main__":
+    for test in (test_brandless_inputs_are_marked, test_known_brand_rows_unchanged, test_similarity_counts_cover_all_rows,
+                 test_normalize_mixed_brackets, test_failed_search_matches_reference):
+        test()
+        print(f"✅ {test.__name__}")